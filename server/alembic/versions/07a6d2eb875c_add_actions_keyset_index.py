@@ -0,0 +1,31 @@
+"""Add (task_id, issued_at, id) index for keyset pagination of actions
+
+Revision ID: 07a6d2eb875c
+Revises: fb9f80851e60
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '07a6d2eb875c'
+down_revision: Union[str, None] = 'fb9f80851e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_actions_task_issued_id',
+        'intervention_actions',
+        ['task_id', 'issued_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_actions_task_issued_id', table_name='intervention_actions')
@@ -0,0 +1,28 @@
+"""Drop idx_actions_action_id, duplicated by the action_id UNIQUE constraint
+
+Revision ID: 0d0e7848ca48
+Revises: b91940d60cb3
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d0e7848ca48'
+down_revision: Union[str, None] = 'b91940d60cb3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The UNIQUE constraint on action_id already maintains a unique B-tree that
+    # serves every lookup; the plain index only doubled the write cost.
+    op.drop_index('idx_actions_action_id', table_name='intervention_actions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_actions_action_id', 'intervention_actions', ['action_id'], unique=False)
@@ -0,0 +1,30 @@
+"""Drop action indexes superseded by idx_actions_task_issued_id
+
+Revision ID: b91940d60cb3
+Revises: 07a6d2eb875c
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91940d60cb3'
+down_revision: Union[str, None] = '07a6d2eb875c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # idx_actions_task_issued_id (added in 07a6d2eb875c) leads with task_id and
+    # carries issued_at, so both single-column indexes are redundant.
+    op.drop_index('idx_actions_task_id', table_name='intervention_actions')
+    op.drop_index('idx_actions_issued_at', table_name='intervention_actions')
+
+
+def downgrade() -> None:
+    op.create_index('idx_actions_issued_at', 'intervention_actions', ['issued_at'], unique=False)
+    op.create_index('idx_actions_task_id', 'intervention_actions', ['task_id'], unique=False)
@@ -15,6 +15,7 @@ from pydantic import BaseModel
 
 from server.api.routes import intervention, metrics, tasks
 from server.infrastructure.cache.idempotency_cache import AsyncIdempotencyCache
+from server.infrastructure.llm.http_client import close_http_client
 from server.infrastructure.llm.provider_registry import ProviderRegistry
 from server.infrastructure.logging.json_formatter import setup_json_logging
 from server.infrastructure.persistence.database import (
@@ -44,6 +45,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
+        await app.state.idempotency_cache.close()
+        await close_http_client()
         if is_database_initialized():
             await get_db_manager().close()
 
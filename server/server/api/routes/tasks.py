@@ -19,7 +19,11 @@ from server.api.dependencies import get_task_repository
 from server.domain.entities.intervention_action import InterventionAction
 from server.domain.entities.task import Task
 from server.domain.models.anchor import Anchor
-from server.domain.repositories.task_repository import TaskRepository
+from server.domain.repositories.task_repository import (
+    MAX_ACTIONS_LIMIT,
+    TaskRepository,
+    TaskVersionConflictError,
+)
 from server.infrastructure.persistence.database import get_session_optional
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -224,8 +228,12 @@ async def update_task(
         if session:
             await session.commit()
         return TaskResponse.from_entity(updated_task)
+    except TaskVersionConflictError as e:
+        # The version-guarded UPDATE lost to a concurrent writer.
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ValueError as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+        # The task was deleted between the lookup above and the update.
+        raise HTTPException(status_code=404, detail=str(e)) from e
 
 
 @router.delete("/{task_id}", status_code=204)
@@ -260,7 +268,7 @@ async def delete_task(
 @router.get("/{task_id}/actions", response_model=InterventionHistoryResponse)
 async def get_intervention_history(
     task_id: UUID,
-    limit: Annotated[int, Query(ge=1, le=100)] = 100,
+    limit: Annotated[int, Query(ge=1, le=MAX_ACTIONS_LIMIT)] = MAX_ACTIONS_LIMIT,
     offset: Annotated[int, Query(ge=0)] = 0,
     repository: TaskRepository = Depends(get_task_repository),
 ) -> InterventionHistoryResponse:
@@ -276,7 +284,8 @@ async def get_intervention_history(
         InterventionHistoryResponse: Paginated intervention history.
 
     Raises:
-        HTTPException: 404 if task not found.
+        HTTPException: 404 if task not found, 422 if offset + limit exceeds the
+            pagination window.
 
     Example:
         ```bash
@@ -292,9 +301,13 @@ async def get_intervention_history(
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    # Get actions and count
-    actions = await repository.get_actions(task_id, limit=limit, offset=offset)
-    total = await repository.get_action_count(task_id)
+    # Get the page and total count together
+    try:
+        actions, total = await repository.get_actions_with_count(
+            task_id, limit=limit, offset=offset
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
 
     return InterventionHistoryResponse(
         total=total,
@@ -11,7 +11,7 @@ Constitutional Compliance:
 """
 
 import time
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from server.domain.errors import LLMProviderError
 from server.domain.llm_provider import LLMProvider
@@ -21,6 +21,7 @@ from server.domain.models.intervention import (
     InterventionResponse,
 )
 from server.domain.text_window import compute_last_sentence_anchor
+from server.infrastructure.llm.ids import next_id
 from server.infrastructure.observability.metrics import log_llm_call
 from server.infrastructure.observability.tracing import start_llm_span
 
@@ -60,7 +61,7 @@ class InterventionService:
             )
         )
 
-        response = service.generate_intervention(request)
+        response = await service.generate_intervention(request)
         assert response.action == "provoke"
         ```
 
@@ -95,7 +96,7 @@ class InterventionService:
         self.llm_provider = llm_provider
         self.task_repository = task_repository
 
-    def generate_intervention(
+    async def generate_intervention(
         self,
         request: InterventionRequest,
         llm_override: LLMProvider | None = None,
@@ -119,7 +120,7 @@ class InterventionService:
 
         Example:
             >>> service = InterventionService(llm_provider)
-            >>> response = service.generate_intervention(request)
+            >>> response = await service.generate_intervention(request)
             >>> response.action
             'provoke'
         """
@@ -147,7 +148,7 @@ class InterventionService:
                     "llm.mode": request.mode,
                 },
             ):
-                response = provider.generate_intervention(
+                response = await provider.generate_intervention(
                     context=request.context,
                     mode=request.mode,
                     doc_version=request.client_meta.doc_version,
@@ -181,7 +182,7 @@ class InterventionService:
         if request.mode == "muse" and response.action == "delete":
             response.action = "provoke"
             response.content = "重新审视你刚写下的句子，再给出更锋利的版本。"
-            response.lock_id = f"lock_{uuid4()}"
+            response.lock_id = next_id("lock")
             response.anchor = AnchorPos.model_validate(
                 {"type": "pos", "from": request.client_meta.selection_from}
             )
@@ -191,7 +192,7 @@ class InterventionService:
             # Override with provoke to prevent document erasure
             response.action = "provoke"
             response.content = "文档内容太少，先扩写细节再让 Loki 介入。"
-            response.lock_id = f"lock_{uuid4()}"
+            response.lock_id = next_id("lock")
             # Update anchor to current cursor position
             # Note: Using model_validate to properly handle field alias
             response.anchor = AnchorPos.model_validate(
@@ -224,11 +225,11 @@ class InterventionService:
 
         # Ensure action_id exists
         if not response.action_id:
-            response.action_id = f"act_{uuid4()}"
+            response.action_id = next_id("act")
 
         # Ensure lock_id exists for mutate actions
         if response.action in {"provoke", "rewrite"} and not response.lock_id:
-            response.lock_id = f"lock_{uuid4()}"
+            response.lock_id = next_id("lock")
 
         return response
 
@@ -239,10 +240,10 @@ class InterventionService:
         repository: "TaskRepository | None" = None,
         llm_override: LLMProvider | None = None,
     ) -> InterventionResponse:
-        """Generate intervention action with optional persistence (async version).
+        """Generate intervention action with optional persistence.
 
-        Same business logic as generate_intervention(), but with async support
-        for persisting intervention history to database via TaskRepository.
+        Same business logic as generate_intervention(), plus persisting
+        intervention history to database via TaskRepository.
 
         Args:
             request: Intervention request with context and mode.
@@ -263,8 +264,7 @@ class InterventionService:
             # Intervention history is automatically persisted to database
             ```
         """
-        # Generate intervention using existing sync logic
-        response = self.generate_intervention(request, llm_override=llm_override)
+        response = await self.generate_intervention(request, llm_override=llm_override)
 
         repo = repository or self.task_repository
         # Persist to database if repository and task_id provided
@@ -12,7 +12,9 @@ Constitutional Compliance:
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from server.domain.uuid7 import uuid7
 
 
 @dataclass
@@ -23,7 +25,7 @@ class InterventionAction:
     Provides audit trail for all provoke and delete actions.
 
     Attributes:
-        id: Unique action entity identifier (UUID v4).
+        id: Unique action entity identifier (UUID v7, time-ordered).
         task_id: Reference to parent task (UUID).
         action_type: Type of intervention ("provoke", "delete", or "rewrite").
         action_id: Client-facing action identifier (e.g., "act_xxxxx").
@@ -144,7 +146,7 @@ class InterventionAction:
             raise ValueError("Provoke/rewrite actions require lock_id and content")
 
         return cls(
-            id=uuid4(),
+            id=uuid7(),
             task_id=task_id,
             action_type=action_type,
             action_id=action_id,
@@ -11,7 +11,9 @@ Constitutional Compliance:
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from server.domain.uuid7 import uuid7
 
 
 @dataclass
@@ -22,7 +24,7 @@ class Task:
     Tasks persist across sessions and track their intervention history.
 
     Attributes:
-        id: Unique task identifier (UUID v4).
+        id: Unique task identifier (UUID v7, time-ordered).
         content: Current task content (Markdown format).
         lock_ids: List of lock IDs for un-deletable content blocks.
         created_at: Task creation timestamp (UTC).
@@ -67,7 +69,7 @@ class Task:
         """
         now = datetime.now(UTC)
         return cls(
-            id=uuid4(),
+            id=uuid7(),
             content=content,
             lock_ids=lock_ids or [],
             created_at=now,
@@ -28,7 +28,7 @@ class LLMProvider(Protocol):
         ```
     """
 
-    def generate_intervention(
+    async def generate_intervention(
         self,
         context: str,
         mode: Literal["muse", "loki"],
@@ -55,7 +55,7 @@ class LLMProvider(Protocol):
 
         Example:
             >>> provider = InstructorLLMProvider(api_key="sk-...")
-            >>> response = provider.generate_intervention(
+            >>> response = await provider.generate_intervention(
             ...     context="他打开门，犹豫着要不要进去。",
             ...     mode="muse"
             ... )
@@ -4,6 +4,8 @@ Anchors define where to inject (provoke) or delete content in the editor.
 Supports three positioning strategies: pos (single point), range (start-end),
 and lock_id (reference to existing locked block).
 
+Anchors are immutable value objects; replace an anchor instead of editing it.
+
 Constitutional Compliance:
 - Article V (Documentation): Comprehensive docstrings for all types
 """
@@ -31,7 +33,7 @@ class AnchorPos(BaseModel):
         ```
     """
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     type: Literal["pos"] = "pos"
     from_: int = Field(..., alias="from", ge=0, description="ProseMirror position (0-based)")
@@ -57,7 +59,7 @@ class AnchorRange(BaseModel):
         ```
     """
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     type: Literal["range"] = "range"
     from_: int = Field(..., alias="from", ge=0, description="Start position (inclusive)")
@@ -82,6 +84,8 @@ class AnchorLockId(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["lock_id"] = "lock_id"
     ref_lock_id: str = Field(..., min_length=1, description="UUID of referenced lock")
 
@@ -9,9 +9,9 @@ Constitutional Compliance:
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from server.domain.models.anchor import Anchor
 
@@ -34,6 +34,8 @@ class ClientMeta(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     doc_version: int = Field(..., ge=0, description="Document version counter")
     selection_from: int = Field(..., ge=0, description="Cursor/selection start position")
     selection_to: int = Field(..., ge=0, description="Selection end position")
@@ -65,6 +67,8 @@ class InterventionRequest(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     context: str = Field(
         ..., min_length=1, max_length=2000, description="Writing context (last N sentences)"
     )
@@ -126,6 +130,9 @@ class InterventionResponse(BaseModel):
         ```
     """
 
+    # Not frozen: InterventionService post-processes responses in place.
+    model_config = ConfigDict(extra="forbid")
+
     action: Literal["provoke", "delete", "rewrite"] = Field(
         ...,
         description=(
@@ -153,10 +160,29 @@ class InterventionResponse(BaseModel):
         default_factory=datetime.utcnow, description="Server timestamp when action was generated"
     )
 
+    @classmethod
+    def build_trusted(cls, **fields: Any) -> "InterventionResponse":
+        """Build a response from server-assembled fields without field validation.
+
+        Providers assemble responses from an already-validated LLM draft plus
+        server-generated ids and anchors, so per-field coercion is skipped via
+        ``model_construct``. The cross-field payload rules still apply.
+
+        Raises:
+            ValueError: If the payload violates the per-action requirements.
+        """
+
+        return cls.model_construct(**fields)._apply_payload_rules()
+
     @model_validator(mode="after")
     def _validate_payload(self) -> "InterventionResponse":
         """Ensure required fields exist for each action type."""
 
+        return self._apply_payload_rules()
+
+    def _apply_payload_rules(self) -> "InterventionResponse":
+        """Enforce per-action content/lock/anchor requirements."""
+
         if self.action in {"provoke", "rewrite"}:
             if not self.content or not self.content.strip():
                 raise ValueError("content is required for provoke/rewrite actions")
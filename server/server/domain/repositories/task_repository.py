@@ -10,18 +10,60 @@ Constitutional Compliance:
 - Article V (Documentation): Complete Google-style docstrings
 """
 
-from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Final, Protocol
 from uuid import UUID
 
 from server.domain.entities.intervention_action import InterventionAction
 from server.domain.entities.task import Task
 
+# Keyset pagination position: (issued_at, id) of the last action already seen.
+ActionCursor = tuple[datetime, UUID]
 
-class TaskRepository(ABC):
+# Largest page of actions a single call may request.
+MAX_ACTIONS_LIMIT: Final = 100
+# Offset pagination makes the database walk and discard every skipped row, so
+# ``offset + limit`` is capped; deeper history must be read with a cursor.
+MAX_ACTIONS_OFFSET_WINDOW: Final = 10_000
+
+
+class TaskVersionConflictError(ValueError):
+    """Raised by ``update_task`` when the stored task is not at the expected version.
+
+    Subclasses ``ValueError`` so callers that only distinguish repository errors
+    keep working; callers that need to tell a stale write from a missing task
+    (e.g. 409 vs 404) catch this first.
+    """
+
+
+def validate_action_page(limit: int, offset: int) -> None:
+    """Reject action page bounds that would make a history query unbounded.
+
+    Args:
+        limit: Requested page size.
+        offset: Requested number of actions to skip.
+
+    Raises:
+        ValueError: If ``limit`` is outside ``1..MAX_ACTIONS_LIMIT``, ``offset`` is
+            negative, or ``offset + limit`` exceeds ``MAX_ACTIONS_OFFSET_WINDOW``.
+    """
+    if not 1 <= limit <= MAX_ACTIONS_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_ACTIONS_LIMIT}, got {limit}")
+    if offset < 0:
+        raise ValueError(f"offset must be non-negative, got {offset}")
+    if offset + limit > MAX_ACTIONS_OFFSET_WINDOW:
+        raise ValueError(
+            f"offset + limit must not exceed {MAX_ACTIONS_OFFSET_WINDOW}; "
+            "use a cursor to page further back"
+        )
+
+
+class TaskRepository(Protocol):
     """Repository abstraction for task and intervention action persistence.
 
     Defines contract for data access operations without specifying implementation.
     Application services depend on this abstraction (Dependency Inversion Principle).
+    Implementations satisfy it structurally and do not need to inherit from it.
 
     Implementations:
         - PostgreSQLTaskRepository: Production persistence with PostgreSQL
@@ -39,7 +81,6 @@ class TaskRepository(ABC):
         ```
     """
 
-    @abstractmethod
     async def create_task(self, content: str, lock_ids: list[str]) -> Task:
         """Create new task with content and lock IDs.
 
@@ -60,9 +101,8 @@ class TaskRepository(ABC):
             assert task.version == 0
             ```
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_task(self, task_id: UUID) -> Task | None:
         """Get task by ID.
 
@@ -79,9 +119,26 @@ class TaskRepository(ABC):
                 print(f"Found task: {task.content}")
             ```
         """
-        pass
+        ...
+
+    async def get_tasks(self, task_ids: list[UUID]) -> dict[UUID, Task]:
+        """Get several tasks by ID in one lookup.
+
+        Args:
+            task_ids: Task UUIDs to fetch.
+
+        Returns:
+            dict[UUID, Task]: Found tasks keyed by ID; missing IDs are absent.
+
+        Example:
+            ```python
+            tasks = await repository.get_tasks([first_id, second_id])
+            if first_id in tasks:
+                print(tasks[first_id].content)
+            ```
+        """
+        ...
 
-    @abstractmethod
     async def update_task(self, task: Task) -> Task:
         """Update existing task (optimistic locking).
 
@@ -92,7 +149,9 @@ class TaskRepository(ABC):
             Task: Updated task with incremented version.
 
         Raises:
-            ValueError: If task not found or version mismatch (optimistic locking).
+            TaskVersionConflictError: If the stored version is not ``task.version - 1``
+                (another writer updated the task first).
+            ValueError: If task not found.
 
         Example:
             ```python
@@ -102,9 +161,8 @@ class TaskRepository(ABC):
             assert updated.version == task.version
             ```
         """
-        pass
+        ...
 
-    @abstractmethod
     async def delete_task(self, task_id: UUID) -> None:
         """Delete task and all associated intervention actions.
 
@@ -121,9 +179,8 @@ class TaskRepository(ABC):
             assert task is None
             ```
         """
-        pass
+        ...
 
-    @abstractmethod
     async def save_action(self, action: InterventionAction) -> InterventionAction:
         """Save intervention action to history (audit log).
 
@@ -150,11 +207,48 @@ class TaskRepository(ABC):
             assert saved.id == action.id
             ```
         """
-        pass
+        ...
+
+    async def save_actions(self, actions: list[InterventionAction]) -> list[InterventionAction]:
+        """Save several intervention actions at once (batched audit log write).
+
+        Args:
+            actions: InterventionAction entities to persist.
+
+        Returns:
+            list[InterventionAction]: Saved actions, in the given order.
+
+        Example:
+            ```python
+            saved = await repository.save_actions([first_action, second_action])
+            assert [a.id for a in saved] == [first_action.id, second_action.id]
+            ```
+        """
+        ...
+
+    async def has_actions(self, action_ids: list[str]) -> list[bool]:
+        """Check which client-facing action IDs are already recorded.
+
+        Args:
+            action_ids: Action identifiers (e.g., "act_xxxxx").
+
+        Returns:
+            list[bool]: One flag per input ID, in the same order.
+
+        Example:
+            ```python
+            exists = await repository.has_actions(["act_001", "act_002"])
+            ```
+        """
+        ...
 
-    @abstractmethod
     async def get_actions(
-        self, task_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        task_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: ActionCursor | None = None,
     ) -> list[InterventionAction]:
         """Get intervention action history for task (paginated).
 
@@ -162,9 +256,16 @@ class TaskRepository(ABC):
             task_id: Task UUID.
             limit: Maximum number of actions to return (default 100).
             offset: Number of actions to skip for pagination (default 0).
+            cursor: Keyset position ``(issued_at, id)`` of the last action of the
+                previous page; only older actions are returned. Unlike ``offset``,
+                the cost does not grow with page depth.
 
         Returns:
-            list[InterventionAction]: Actions in reverse chronological order (newest first).
+            list[InterventionAction]: Actions in reverse chronological order (newest first),
+                ties broken by id (descending).
+
+        Raises:
+            ValueError: If the page bounds fail ``validate_action_page``.
 
         Example:
             ```python
@@ -175,11 +276,43 @@ class TaskRepository(ABC):
 
             # Get next page
             next_actions = await repository.get_actions(task_id, limit=10, offset=10)
+
+            # Or continue after the last action seen (keyset pagination)
+            last = actions[-1]
+            next_actions = await repository.get_actions(
+                task_id, limit=10, cursor=(last.issued_at, last.id)
+            )
+            ```
+        """
+        ...
+
+    async def get_actions_with_count(
+        self, task_id: UUID, limit: int = 100, offset: int = 0
+    ) -> tuple[list[InterventionAction], int]:
+        """Get a page of intervention actions together with the task's total count.
+
+        Equivalent to calling ``get_actions`` and ``get_action_count``, but lets
+        implementations answer both from a single query.
+
+        Args:
+            task_id: Task UUID.
+            limit: Maximum number of actions to return (default 100).
+            offset: Number of actions to skip for pagination (default 0).
+
+        Returns:
+            tuple[list[InterventionAction], int]: Actions newest first, and the
+                total number of actions for this task (ignoring limit/offset).
+
+        Raises:
+            ValueError: If the page bounds fail ``validate_action_page``.
+
+        Example:
+            ```python
+            actions, total = await repository.get_actions_with_count(task_id, limit=10)
             ```
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_action_count(self, task_id: UUID) -> int:
         """Get total count of intervention actions for task.
 
@@ -195,4 +328,4 @@ class TaskRepository(ABC):
             pages = (count + 99) // 100  # Calculate number of pages (100 per page)
             ```
         """
-        pass
+        ...
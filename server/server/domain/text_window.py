@@ -11,31 +11,16 @@ Constitutional Compliance:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Final
 
 SENTENCE_BOUNDARIES: Final[tuple[str, ...]] = ("。", "！", "？", "!", "?", ".")
 
 
-def _strip_trailing_whitespace(value: str) -> str:
-    """Trim trailing whitespace but preserve intentional mid-sentence spacing."""
-
-    return value.rstrip()
-
-
-def _strip_leading_whitespace(value: str) -> str:
-    """Remove leading whitespace characters from a fragment."""
-
-    offset = 0
-    length = len(value)
-    while offset < length and value[offset].isspace():
-        offset += 1
-    return value[offset:]
-
-
 def _slice_sentences(context: str) -> list[str]:
     """Split context into rough sentences using punctuation and newlines."""
 
-    trimmed = _strip_trailing_whitespace(context)
+    trimmed = context.rstrip()
     if not trimmed:
         return []
 
@@ -74,11 +59,18 @@ def compute_last_sentence_length(
         Number of characters belonging to the most recent sentence.
     """
 
+    return _cached_last_sentence_length(context, min_length, max_length)
+
+
+@lru_cache(maxsize=16)
+def _cached_last_sentence_length(context: str, min_length: int, max_length: int) -> int:
+    """Memoized sentence scan shared by the length and anchor helpers."""
+
     sentences = _slice_sentences(context)
     if not sentences:
         return min_length
 
-    candidate = _strip_leading_whitespace(sentences[-1])
+    candidate = sentences[-1].lstrip()
     if not candidate:
         return min_length
 
@@ -11,7 +11,10 @@ Constitutional Compliance:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 
@@ -20,50 +23,111 @@ class AsyncIdempotencyCache:
 
     Stores intervention responses keyed by Idempotency-Key header (UUID).
     Entries expire after 15 seconds (configurable TTL).
-    Uses asyncio locks to avoid blocking the event loop.
+    The methods stay ``async`` for callers, but no lock is taken: each one
+    reads and mutates the dict without awaiting, so on a single event loop it
+    runs to completion before any other coroutine can observe the cache.
+
+    Every entry shares the same TTL, so keeping entries in insertion order also
+    keeps them in expiry order. A background reaper task sleeps until the oldest
+    entry expires and exits once the cache is empty; the next ``set`` restarts it.
+    At most ``maxsize`` entries are kept; the oldest are evicted first.
+
+    Args:
+        ttl: Entry lifetime in seconds.
+        maxsize: Maximum number of cached responses.
+        clock: Monotonic nanosecond clock (injectable so tests can time-travel).
     """
 
-    def __init__(self, ttl: int = 15):
-        self.ttl = ttl
-        self._cache: dict[str, tuple[Any, float]] = {}
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        ttl: float = 15,
+        maxsize: int = 2048,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ):
+        self.ttl = float(ttl)
+        self.maxsize = maxsize
+        self._clock = clock
+        # Expiries are integer nanoseconds on the monotonic clock.
+        self._ttl_ns = int(self.ttl * 1_000_000_000)
+        self._cache: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._reaper: asyncio.Task[None] | None = None
 
     async def get(self, key: str) -> Any | None:
         """Retrieve cached response if not expired."""
 
-        async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
-            response, expiry = entry
-            if time.time() > expiry:
-                self._cache.pop(key, None)
-                return None
+        response, expiry = entry
+        if self._clock() > expiry:
+            self._cache.pop(key, None)
+            return None
 
-            return response
+        return response
 
     async def set(self, key: str, response: Any) -> None:
         """Store response in cache with TTL expiry."""
 
-        async with self._lock:
-            expiry = time.time() + self.ttl
-            self._cache[key] = (response, expiry)
+        expiry = self._clock() + self._ttl_ns
+        self._cache[key] = (response, expiry)
+        # Re-setting a key pushes its expiry out, so keep the order by expiry.
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        self._ensure_reaper()
 
     async def clear(self) -> None:
         """Clear all cached entries (useful for testing)."""
 
-        async with self._lock:
-            self._cache.clear()
+        self._cache.clear()
 
     async def cleanup_expired(self) -> int:
         """Remove all expired entries from cache."""
 
-        async with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, (_, expiry) in self._cache.items() if current_time > expiry
-            ]
-            for key in expired_keys:
-                self._cache.pop(key, None)
-            return len(expired_keys)
+        return self._evict_expired(self._clock())
+
+    async def close(self) -> None:
+        """Cancel the background reaper (call on application shutdown)."""
+
+        reaper, self._reaper = self._reaper, None
+        if reaper is None or reaper.done():
+            return
+        if reaper.get_loop() is not asyncio.get_running_loop():
+            # The loop that owned the reaper is gone; nothing left to await.
+            return
+        reaper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reaper
+
+    def _evict_expired(self, now: int) -> int:
+        """Pop entries from the head of the cache until one is still live."""
+
+        removed = 0
+        while self._cache:
+            _, expiry = next(iter(self._cache.values()))
+            if expiry >= now:
+                break
+            self._cache.popitem(last=False)
+            removed += 1
+        return removed
+
+    def _ensure_reaper(self) -> None:
+        """Start the reaper on the running loop unless one is already active."""
+
+        reaper = self._reaper
+        loop = asyncio.get_running_loop()
+        if reaper is not None and not reaper.done() and reaper.get_loop() is loop:
+            return
+        self._reaper = loop.create_task(self._reap_expired())
+
+    async def _reap_expired(self) -> None:
+        """Sleep until the oldest entry expires, evict it, and repeat."""
+
+        while self._cache:
+            _, expiry = next(iter(self._cache.values()))
+            now = self._clock()
+            if expiry >= now:
+                await asyncio.sleep((expiry - now + 1) / 1_000_000_000)
+                continue
+            self._evict_expired(now)
@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Final, cast
+
 from anthropic import (
-    Anthropic,
     APIError,
+    AsyncAnthropic,
     AuthenticationError,
     RateLimitError,
 )
-from anthropic.types import Message, MessageParam, TextBlock
+from anthropic.types import MessageParam, TextBlockParam
 
 from server.domain.errors import LLMProviderError
-from server.infrastructure.llm.base_provider import BasePromptLLMProvider, LLMInterventionDraft
+from server.infrastructure.llm.base_provider import (
+    DRAFT_ADAPTER,
+    BasePromptLLMProvider,
+    LLMInterventionDraft,
+)
+from server.infrastructure.llm.http_client import SDK_HTTP_TIMEOUT, get_http_client
+
+# Abort the stream when no text chunk arrives for this many seconds.
+STREAM_STALL_TIMEOUT: Final[float] = 15.0
 
 
 class AnthropicLLMProvider(BasePromptLLMProvider):
-    """Anthropic Messages API implementation."""
+    """Anthropic Messages API implementation.
+
+    Responses are streamed so a stalled connection is detected by a dead-man
+    timer (``STREAM_STALL_TIMEOUT`` without a chunk) rather than relying on the
+    SDK's transport timeout alone.
+    """
 
     provider_name = "anthropic"
 
@@ -24,31 +40,51 @@ class AnthropicLLMProvider(BasePromptLLMProvider):
         api_key: str,
         model: str = "claude-3-5-haiku-latest",
         temperature: float = 0.8,
+        requests_per_minute: float | None = None,
+        repeat_within_session: bool = False,
     ) -> None:
-        super().__init__(model=model, temperature=temperature)
-        self.client = Anthropic(api_key=api_key)
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            requests_per_minute=requests_per_minute,
+            repeat_within_session=repeat_within_session,
+        )
+        self.client = AsyncAnthropic(
+            api_key=api_key, http_client=get_http_client(), timeout=SDK_HTTP_TIMEOUT
+        )
 
-    def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
-        payload: list[MessageParam] = [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": user_message,
-                    }
-                ],
-            }
-        ]
+    async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+        payload: list[MessageParam] = [{"role": "user", "content": user_message}]
+        # Mark the static system prompt as a prompt-cache breakpoint. The SDK's
+        # TextBlockParam predates the cache_control key, hence the cast.
+        system = cast(
+            TextBlockParam,
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}},
+        )
 
+        chunks: list[str] = []
         try:
-            message: Message = self.client.messages.create(
-                model=self.model,
-                temperature=self.temperature,
-                max_tokens=400,
-                system=system_prompt,
-                messages=payload,
-            )
+            async with (
+                asyncio.timeout(STREAM_STALL_TIMEOUT) as deadline,
+                self.client.messages.stream(
+                    model=self.model,
+                    temperature=self.temperature,
+                    max_tokens=400,
+                    system=[system],
+                    messages=payload,
+                ) as stream,
+            ):
+                loop = asyncio.get_running_loop()
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    deadline.reschedule(loop.time() + STREAM_STALL_TIMEOUT)
+        except TimeoutError as exc:
+            raise LLMProviderError(
+                code="llm_timeout",
+                message=f"Anthropic stream stalled for over {STREAM_STALL_TIMEOUT:.0f}s.",
+                status_code=504,
+                provider=self.provider_name,
+            ) from exc
         except RateLimitError as exc:  # pragma: no cover - SDK provides typed error
             raise LLMProviderError(
                 code="quota_exceeded",
@@ -78,8 +114,7 @@ class AnthropicLLMProvider(BasePromptLLMProvider):
                 provider=self.provider_name,
             ) from exc
 
-        text_blocks = [block.text for block in message.content if isinstance(block, TextBlock)]
-        if not text_blocks:
+        if not chunks:
             raise LLMProviderError(
                 code="invalid_response",
                 message="Anthropic returned no text blocks",
@@ -87,4 +122,4 @@ class AnthropicLLMProvider(BasePromptLLMProvider):
                 provider=self.provider_name,
             )
 
-        return LLMInterventionDraft.model_validate_json(text_blocks[0])
+        return DRAFT_ADAPTER.validate_json("".join(chunks))
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-import uuid
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Literal
+from typing import Final, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from server.domain.errors import LLMProviderError
 from server.domain.llm_provider import LLMProvider
 from server.domain.models.anchor import AnchorPos, AnchorRange
 from server.domain.models.intervention import InterventionResponse
+from server.infrastructure.llm.draft_cache import DraftCache
+from server.infrastructure.llm.ids import next_id
 from server.infrastructure.llm.prompts.loki_prompt import get_loki_prompts
 from server.infrastructure.llm.prompts.muse_prompt import get_muse_prompts
+from server.infrastructure.llm.prompts.prompt_registry import get_prompt_template
+from server.infrastructure.llm.rate_limit import TokenBucket
 
 
 class LLMInterventionDraft(BaseModel):
@@ -22,16 +28,58 @@ class LLMInterventionDraft(BaseModel):
     content: str | None = None
 
 
+# Module-level adapter reused by providers that parse raw JSON text responses.
+DRAFT_ADAPTER: Final[TypeAdapter[LLMInterventionDraft]] = TypeAdapter(LLMInterventionDraft)
+
+_MODES: Final[frozenset[str]] = frozenset({"muse", "loki"})
+_MUTATE_ACTIONS: Final[frozenset[str]] = frozenset({"provoke", "rewrite"})
+
+# Only the tail of the document reaches the prompt (matches the API's max_length).
+PROMPT_CONTEXT_TAIL: Final[int] = 2000
+
+# After the provider reports an exhausted quota, fail fast locally for this long.
+QUOTA_BREAKER_SECONDS: Final[float] = 30.0
+
+# Above this temperature a replayed draft defeats asking for a fresh one.
+DRAFT_REPLAY_MAX_TEMPERATURE: Final[float] = 0.3
+
+
 class BasePromptLLMProvider(LLMProvider, ABC):
-    """Base class implementing shared intervention -> response plumbing."""
+    """Base class implementing shared intervention -> response plumbing.
+
+    Concurrent Muse requests for the same context share one in-flight
+    provider call. Replaying a finished Muse draft for a repeated context
+    (briefly, per template version, via ``draft_cache``) is opt-in through
+    ``repeat_within_session`` and only honoured up to
+    ``DRAFT_REPLAY_MAX_TEMPERATURE``; otherwise every repeat gets a fresh
+    draft. Loki is meant to be unpredictable, so its calls always reach the
+    provider.
+
+    Calls that do reach the provider pass an optional token bucket
+    (``requests_per_minute``) and a quota circuit breaker: once the provider
+    reports ``quota_exceeded``, further calls are rejected locally for
+    ``QUOTA_BREAKER_SECONDS`` before the next one is allowed through to probe.
+    """
 
     provider_name: str = "generic"
 
-    def __init__(self, *, model: str, temperature: float = 0.9) -> None:
+    def __init__(
+        self,
+        *,
+        model: str,
+        temperature: float = 0.9,
+        requests_per_minute: float | None = None,
+        repeat_within_session: bool = False,
+    ) -> None:
         self.model = model
         self.temperature = temperature
+        self.replay_drafts = repeat_within_session and temperature <= DRAFT_REPLAY_MAX_TEMPERATURE
+        self.draft_cache = DraftCache()
+        self._inflight: dict[bytes, asyncio.Task[LLMInterventionDraft]] = {}
+        self._limiter = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._breaker_open_until = 0.0
 
-    def generate_intervention(
+    async def generate_intervention(
         self,
         context: str,
         mode: Literal["muse", "loki"],
@@ -41,15 +89,24 @@ class BasePromptLLMProvider(LLMProvider, ABC):
     ) -> InterventionResponse:
         if not context:
             raise ValueError("Context cannot be empty")
-        if mode not in {"muse", "loki"}:
+        if mode not in _MODES:
             raise ValueError(f"Invalid mode: {mode}")
 
+        # Selection offsets still refer to the full document; only the prompt is trimmed.
+        if len(context) > PROMPT_CONTEXT_TAIL:
+            context = context[-PROMPT_CONTEXT_TAIL:]
+
+        cache_key: bytes | None = None
         if mode == "muse":
-            system_prompt, user_message = get_muse_prompts(context)
+            version = get_prompt_template(mode).version
+            key = DraftCache.make_key(mode, version, self.model, context)
+            cached = None
+            if self.replay_drafts:
+                cache_key = key
+                cached = self.draft_cache.get(key)
+            draft = cached or await self._complete_shared(key, context)
         else:
-            system_prompt, user_message = get_loki_prompts(context)
-
-        draft = self._complete(system_prompt, user_message)
+            draft = await self._guarded_complete(*get_loki_prompts(context))
 
         cursor_pos = selection_to or selection_from or 0
         cursor_pos = max(0, cursor_pos)
@@ -62,20 +119,68 @@ class BasePromptLLMProvider(LLMProvider, ABC):
         lock_id = None
         content = draft.content
 
-        if draft.action in {"provoke", "rewrite"}:
+        if draft.action in _MUTATE_ACTIONS:
             if not content:
                 raise ValueError("LLM returned mutate action without content")
-            lock_id = f"lock_{uuid.uuid4()}"
+            lock_id = next_id("lock")
+        else:
+            content = None
 
-        return InterventionResponse(
+        response = InterventionResponse.build_trusted(
             action=draft.action,
-            content=content if draft.action in {"provoke", "rewrite"} else None,
+            content=content,
             lock_id=lock_id,
             anchor=anchor,
-            action_id=f"act_{uuid.uuid4()}",
+            action_id=next_id("act"),
             source=mode,
         )
+        # Only drafts that produced a valid response are worth replaying.
+        if cache_key is not None:
+            self.draft_cache.set(cache_key, draft)
+        return response
+
+    async def _complete_shared(self, key: bytes, context: str) -> LLMInterventionDraft:
+        """Join an identical in-flight Muse completion, or start one.
+
+        The shared task is shielded so one caller cancelling (e.g. a client
+        disconnect) does not abort the call for everyone else waiting on it.
+        """
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._guarded_complete(*get_muse_prompts(context)))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release_inflight(key, done))
+        return await asyncio.shield(task)
+
+    def _release_inflight(self, key: bytes, task: asyncio.Task[LLMInterventionDraft]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            task.exception()
+
+    async def _guarded_complete(
+        self, system_prompt: str, user_message: str
+    ) -> LLMInterventionDraft:
+        """Run ``_complete`` behind the quota breaker and optional rate limiter."""
+
+        if time.monotonic() < self._breaker_open_until:
+            raise LLMProviderError(
+                code="quota_exceeded",
+                message="Provider quota recently exceeded. Try again shortly.",
+                status_code=402,
+                provider=self.provider_name,
+            )
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        try:
+            return await self._complete(system_prompt, user_message)
+        except LLMProviderError as exc:
+            if exc.code == "quota_exceeded":
+                self._breaker_open_until = time.monotonic() + QUOTA_BREAKER_SECONDS
+            raise
 
     @abstractmethod
-    def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
-        """Subclasses call their provider SDK and return a validated draft."""
+    async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+        """Subclasses await their provider's async SDK and return a validated draft."""
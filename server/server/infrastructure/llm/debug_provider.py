@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import itertools
+import time
 from datetime import UTC, datetime
 from typing import Literal
 
@@ -9,6 +11,10 @@ from server.domain.llm_provider import LLMProvider
 from server.domain.models.anchor import AnchorPos
 from server.domain.models.intervention import InterventionResponse
 
+# Seeded from the wall clock so IDs stay unique across restarts, then counted
+# so back-to-back calls within one millisecond no longer collide.
+_lock_counter = itertools.count(time.time_ns() // 1_000_000)
+
 
 class DebugLLMProvider(LLMProvider):
     """Simple provider that returns deterministic responses without external calls."""
@@ -18,7 +24,7 @@ class DebugLLMProvider(LLMProvider):
     def __init__(self, *, mode: Literal["provoke", "rewrite"] = "provoke") -> None:
         self.mode = mode
 
-    def generate_intervention(
+    async def generate_intervention(
         self,
         context: str,
         mode: Literal["muse", "loki"],
@@ -36,15 +42,14 @@ class DebugLLMProvider(LLMProvider):
             content = f"{snippet} 试着写出意外的转折。"
 
         # Provide unique lock ids to avoid reusing the same debug lock
-        issued = datetime.now(UTC)
-        lock_id = f"lock_debug_{mode}_{int(issued.timestamp() * 1000)}"
+        lock_id = f"lock_debug_{mode}_{next(_lock_counter)}"
 
-        return InterventionResponse(
+        return InterventionResponse.build_trusted(
             action="provoke",
             content=content,
             lock_id=lock_id,
             anchor=AnchorPos(from_=cursor),
             action_id="act_debug",
-            issued_at=issued,
+            issued_at=datetime.now(UTC),
             source=mode,
         )
@@ -0,0 +1,62 @@
+"""Exact-match LRU cache for LLM intervention drafts.
+
+Muse re-triggers after every idle period, often with an unchanged context.
+Caching the validated draft per (mode, template version, model, context) lets
+those repeats skip the provider round-trip entirely. Entries expire after a
+short TTL so a writer parked on one paragraph still sees fresh ideas later.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from server.infrastructure.llm.base_provider import LLMInterventionDraft
+
+
+class DraftCache:
+    """Bounded LRU mapping of prompt digests to validated drafts, with TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 120.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[bytes, tuple[LLMInterventionDraft, float]] = OrderedDict()
+
+    @staticmethod
+    def make_key(mode: str, version: str, model: str, context: str) -> bytes:
+        """Digest the inputs that fully determine the provider request."""
+
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (mode, version, model, context):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.digest()
+
+    def get(self, key: bytes) -> LLMInterventionDraft | None:
+        """Return the cached draft if still fresh and mark it most recently used."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        draft, expiry = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return draft
+
+    def set(self, key: bytes, draft: LLMInterventionDraft) -> None:
+        """Store a draft, evicting the least recently used entry when full."""
+
+        self._entries[key] = (draft, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached drafts."""
+
+        self._entries.clear()
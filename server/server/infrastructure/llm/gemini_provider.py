@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+from typing import Final
+
 import httpx
+import orjson
 
 from server.domain.errors import LLMProviderError
-from server.infrastructure.llm.base_provider import BasePromptLLMProvider, LLMInterventionDraft
+from server.infrastructure.llm.base_provider import (
+    DRAFT_ADAPTER,
+    BasePromptLLMProvider,
+    LLMInterventionDraft,
+)
+from server.infrastructure.llm.http_client import LLM_HTTP_TIMEOUT, get_http_client
 
 _GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transient failures are retried with jittered exponential backoff. A longer
+# Retry-After than _MAX_RETRY_DELAY means real quota pressure, so fail fast.
+_RETRYABLE_STATUSES: Final = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS: Final = 3
+_MAX_RETRY_DELAY: Final = 2.0
 
 
 class GeminiLLMProvider(BasePromptLLMProvider):
@@ -20,11 +37,18 @@ class GeminiLLMProvider(BasePromptLLMProvider):
         api_key: str,
         model: str = "gemini-2.0-flash-lite",
         temperature: float = 0.7,
+        requests_per_minute: float | None = None,
+        repeat_within_session: bool = False,
     ) -> None:
-        super().__init__(model=model, temperature=temperature)
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            requests_per_minute=requests_per_minute,
+            repeat_within_session=repeat_within_session,
+        )
         self.api_key = api_key
 
-    def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+    async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
         payload = {
             "systemInstruction": {
                 "parts": [{"text": system_prompt}],
@@ -47,7 +71,7 @@ class GeminiLLMProvider(BasePromptLLMProvider):
         url = f"{_GEMINI_API_BASE}/models/{self.model}:generateContent?key={self.api_key}"
 
         try:
-            response = httpx.post(url, json=payload, timeout=20)
+            response = await self._post_with_retry(url, orjson.dumps(payload))
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             status = exc.response.status_code
@@ -77,7 +101,7 @@ class GeminiLLMProvider(BasePromptLLMProvider):
                 provider=self.provider_name,
             ) from exc
 
-        data = response.json()
+        data = orjson.loads(response.content)
         candidates = data.get("candidates", [])
         if not candidates:
             raise LLMProviderError(
@@ -98,4 +122,33 @@ class GeminiLLMProvider(BasePromptLLMProvider):
                 provider=self.provider_name,
             )
 
-        return LLMInterventionDraft.model_validate_json(text)
+        return DRAFT_ADAPTER.validate_json(text)
+
+    async def _post_with_retry(self, url: str, body: bytes) -> httpx.Response:
+        """POST ``body``, retrying transient 429/5xx responses a bounded number of times."""
+
+        client = get_http_client()
+        attempt = 0
+        while True:
+            response = await client.post(
+                url, content=body, headers=_JSON_HEADERS, timeout=LLM_HTTP_TIMEOUT
+            )
+            attempt += 1
+            if response.status_code not in _RETRYABLE_STATUSES or attempt >= _MAX_ATTEMPTS:
+                return response
+            delay = _retry_delay(response, attempt)
+            if delay > _MAX_RETRY_DELAY:
+                return response
+            await asyncio.sleep(delay)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Honor a numeric Retry-After header, else back off exponentially with jitter."""
+
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return 0.25 * 2.0 ** (attempt - 1) + random.random() * 0.1
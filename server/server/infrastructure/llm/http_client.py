@@ -0,0 +1,39 @@
+"""Process-wide HTTP client shared by the LLM providers.
+
+Reusing one pooled ``httpx.AsyncClient`` keeps TCP/TLS connections to the
+provider endpoints alive between interventions, and HTTP/2 lets concurrent
+calls to the same host share a single connection.
+
+The client itself keeps httpx's default timeout: the OpenAI and Anthropic SDKs
+adopt a non-default client timeout as their own, so each caller passes an
+explicit one instead (``LLM_HTTP_TIMEOUT`` for raw Gemini requests,
+``SDK_HTTP_TIMEOUT`` for the SDK clients, which also retry on their own).
+"""
+
+from __future__ import annotations
+
+import httpx
+
+LLM_HTTP_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+SDK_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=128)
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use (or after close)."""
+
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(http2=True, limits=LLM_HTTP_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from the FastAPI lifespan on shutdown)."""
+
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
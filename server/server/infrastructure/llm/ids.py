@@ -0,0 +1,30 @@
+"""Random identifiers for lock and action IDs.
+
+``uuid.uuid4()`` makes one ``os.urandom(16)`` syscall per ID and builds a UUID
+object just to format it. Interventions mint two IDs each, so draw entropy in
+4 KiB batches instead and hex-encode 16-byte slices directly.
+"""
+
+from __future__ import annotations
+
+import binascii
+import os
+import threading
+from typing import Final
+
+_ID_BYTES: Final = 16
+_POOL_BYTES: Final = 4096
+
+_pool = memoryview(b"")
+_lock = threading.Lock()
+
+
+def next_id(prefix: str) -> str:
+    """Return ``"<prefix>_<32 hex chars>"`` carrying 128 random bits."""
+
+    global _pool
+    with _lock:
+        if len(_pool) < _ID_BYTES:
+            _pool = memoryview(os.urandom(_POOL_BYTES))
+        chunk, _pool = _pool[:_ID_BYTES], _pool[_ID_BYTES:]
+    return f"{prefix}_{binascii.hexlify(chunk).decode('ascii')}"
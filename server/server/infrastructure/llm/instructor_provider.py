@@ -2,34 +2,106 @@
 
 from __future__ import annotations
 
+from typing import Final
+
 import instructor
-from openai import APIError, AuthenticationError, OpenAI, RateLimitError
+from openai import APIError, AsyncOpenAI, AuthenticationError, RateLimitError
+from openai.types.chat import ChatCompletionMessageParam
+from openai.types.shared_params import ResponseFormatJSONSchema
 
 from server.domain.errors import LLMProviderError
-from server.infrastructure.llm.base_provider import BasePromptLLMProvider, LLMInterventionDraft
+from server.infrastructure.llm.base_provider import (
+    DRAFT_ADAPTER,
+    BasePromptLLMProvider,
+    LLMInterventionDraft,
+)
+from server.infrastructure.llm.http_client import SDK_HTTP_TIMEOUT, get_http_client
+from server.infrastructure.llm.prompts.prompt_registry import find_prompt_cache_key
+
+# Models that honour strict ``json_schema`` response formats (Structured Outputs).
+_STRUCTURED_OUTPUT_PREFIXES: Final = ("gpt-4o", "gpt-4.1", "gpt-5")
+_STRUCTURED_OUTPUT_EXCLUDED: Final = frozenset({"gpt-4o-2024-05-13"})
+
+# Strict mode requires every property listed as required and no extra keys, so
+# the optional ``content`` field is expressed as a nullable string.
+_DRAFT_RESPONSE_FORMAT: Final[ResponseFormatJSONSchema] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "intervention_draft",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "action": {"type": "string", "enum": ["provoke", "delete", "rewrite"]},
+                "content": {"type": ["string", "null"]},
+            },
+            "required": ["action", "content"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 
 class InstructorLLMProvider(BasePromptLLMProvider):
-    """OpenAI provider that leverages Instructor for Pydantic validation."""
+    """OpenAI provider that leverages Instructor for Pydantic validation.
+
+    Models supporting Structured Outputs are constrained to the draft schema at
+    sampling time via a strict ``json_schema`` response format, so no validation
+    retries are needed; other models go through Instructor's re-prompting path.
+    """
 
     provider_name = "openai"
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini", temperature: float = 0.9) -> None:
-        super().__init__(model=model, temperature=temperature)
-        self.client = instructor.from_openai(OpenAI(api_key=api_key))
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.9,
+        requests_per_minute: float | None = None,
+        repeat_within_session: bool = False,
+    ) -> None:
+        super().__init__(
+            model=model,
+            temperature=temperature,
+            requests_per_minute=requests_per_minute,
+            repeat_within_session=repeat_within_session,
+        )
+        self._raw = AsyncOpenAI(
+            api_key=api_key, http_client=get_http_client(), timeout=SDK_HTTP_TIMEOUT
+        )
+        self.client = instructor.from_openai(self._raw)
+        self.native_schema = (
+            model.startswith(_STRUCTURED_OUTPUT_PREFIXES)
+            and model not in _STRUCTURED_OUTPUT_EXCLUDED
+        )
 
-    def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+    async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ]
+        # Pin requests sharing a system prompt to one prompt-cache shard. Sent via
+        # extra_body so SDK releases predating the typed parameter still work.
+        cache_key = find_prompt_cache_key(system_prompt)
+        extra_body = {"prompt_cache_key": cache_key} if cache_key else None
         try:
-            completion: LLMInterventionDraft = self.client.chat.completions.create(
+            if not self.native_schema:
+                completion: LLMInterventionDraft = await self.client.chat.completions.create(
+                    model=self.model,
+                    temperature=self.temperature,
+                    response_model=LLMInterventionDraft,
+                    messages=messages,
+                    extra_body=extra_body,
+                )
+                return completion
+
+            raw = await self._raw.chat.completions.create(
                 model=self.model,
                 temperature=self.temperature,
-                response_model=LLMInterventionDraft,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
+                messages=messages,
+                response_format=_DRAFT_RESPONSE_FORMAT,
+                extra_body=extra_body,
             )
-            return completion
         except RateLimitError as exc:  # pragma: no cover - SDK provides typed error
             raise LLMProviderError(
                 code="quota_exceeded",
@@ -58,3 +130,13 @@ class InstructorLLMProvider(BasePromptLLMProvider):
                 status_code=502,
                 provider=self.provider_name,
             ) from exc
+
+        text = raw.choices[0].message.content if raw.choices else None
+        if not text:
+            raise LLMProviderError(
+                code="invalid_response",
+                message="OpenAI returned no structured content",
+                status_code=502,
+                provider=self.provider_name,
+            )
+        return DRAFT_ADAPTER.validate_json(text)
@@ -13,16 +13,21 @@ Success Criteria:
 - SC-006: Safety guard prevents deletion on short documents
 """
 
-from typing import Final
-
 from server.infrastructure.llm.prompts.prompt_registry import (
-    PromptTemplate,
+    PromptPair,
     get_prompt_pair,
     get_prompt_template,
 )
 
-_LOKI_TEMPLATE: PromptTemplate = get_prompt_template("loki")
-LOKI_SYSTEM_PROMPT: Final[str] = _LOKI_TEMPLATE.system_prompt
+
+def __getattr__(name: str) -> str:
+    """Resolve ``LOKI_SYSTEM_PROMPT`` from the current template snapshot.
+
+    Looked up on access (PEP 562) so the value follows ``reload_templates()``.
+    """
+    if name == "LOKI_SYSTEM_PROMPT":
+        return get_prompt_template("loki").system_prompt
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_loki_user_prompt(context: str) -> str:
@@ -43,10 +48,10 @@ def get_loki_user_prompt(context: str) -> str:
         >>> # LLM might return: {"action": "rewrite", "content": "门后其实是台手术桌。"}
         >>> # Or {"action": "delete"} to remove a sentence
     """
-    return _LOKI_TEMPLATE.render_user_prompt(context)
+    return get_prompt_template("loki").render_user_prompt(context)
 
 
-def get_loki_prompts(context: str) -> tuple[str, str]:
+def get_loki_prompts(context: str) -> PromptPair:
     """Get complete prompt pair for Loki mode intervention.
 
     Convenience function that returns both system and user prompts.
@@ -56,7 +61,7 @@ def get_loki_prompts(context: str) -> tuple[str, str]:
         context: Last 3 sentences from user's document.
 
     Returns:
-        Tuple of (system_prompt, user_prompt).
+        PromptPair of (system_prompt, user_prompt).
 
     Example:
         >>> system, user = get_loki_prompts("他打开门，犹豫着要不要进去。")
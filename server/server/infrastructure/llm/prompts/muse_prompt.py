@@ -11,17 +11,21 @@ Success Criteria:
 - SC-005: Intervention relevance score ≥4.0/5.0 (user ratings)
 """
 
-from typing import Final
-
 from server.infrastructure.llm.prompts.prompt_registry import (
-    PromptTemplate,
+    PromptPair,
     get_prompt_pair,
     get_prompt_template,
 )
 
-# System prompt is now sourced from versioned TOML template files.
-_MUSE_TEMPLATE: PromptTemplate = get_prompt_template("muse")
-MUSE_SYSTEM_PROMPT: Final[str] = _MUSE_TEMPLATE.system_prompt
+
+def __getattr__(name: str) -> str:
+    """Resolve ``MUSE_SYSTEM_PROMPT`` from the current template snapshot.
+
+    Looked up on access (PEP 562) so the value follows ``reload_templates()``.
+    """
+    if name == "MUSE_SYSTEM_PROMPT":
+        return get_prompt_template("muse").system_prompt
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_muse_user_prompt(context: str) -> str:
@@ -41,10 +45,10 @@ def get_muse_user_prompt(context: str) -> str:
         >>> prompt = get_muse_user_prompt(context)
         >>> # LLM will generate: {"action": "provoke", "content": "门后忽然传来潮湿的呼吸声。"}
     """
-    return _MUSE_TEMPLATE.render_user_prompt(context)
+    return get_prompt_template("muse").render_user_prompt(context)
 
 
-def get_muse_prompts(context: str) -> tuple[str, str]:
+def get_muse_prompts(context: str) -> PromptPair:
     """Get complete prompt pair for Muse mode intervention.
 
     Convenience function that returns both system and user prompts.
@@ -54,7 +58,7 @@ def get_muse_prompts(context: str) -> tuple[str, str]:
         context: Last 3 sentences from user's document.
 
     Returns:
-        Tuple of (system_prompt, user_prompt).
+        PromptPair of (system_prompt, user_prompt).
 
     Example:
         >>> system, user = get_muse_prompts("他打开门，犹豫着要不要进去。")
@@ -2,71 +2,182 @@
 
 from __future__ import annotations
 
+import logging
+import sys
 import tomllib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from importlib import resources
-from typing import Literal
+from typing import Annotated, Final, Literal, NamedTuple, get_args
+
+from pydantic import BaseModel, StringConstraints, ValidationError
 
 PromptName = Literal["muse", "loki"]
+PROMPT_NAMES: Final[tuple[PromptName, ...]] = get_args(PromptName)
+
+# Provider-side prefix caching only engages for prompts of at least ~1024 tokens.
+PROMPT_CACHE_MIN_TOKENS: Final = 1024
+
+logger = logging.getLogger(__name__)
+
+
+_CONTEXT_PLACEHOLDER = "{{context}}"
+
+_NonBlank = Annotated[str, StringConstraints(pattern=r"\S")]
+
+
+class _PromptFile(BaseModel):
+    """Schema of a ``server/prompts/<name>.toml`` file."""
+
+    version: _NonBlank
+    system: _NonBlank
+    user_template: Annotated[str, StringConstraints(pattern=r"\{\{context\}\}")]
+
 
+class PromptPair(NamedTuple):
+    """Rendered ``(system, user)`` prompts for one provider call."""
 
-@dataclass(frozen=True)
+    system: str
+    user: str
+
+
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
-    """Immutable prompt template with helper rendering utilities."""
+    """Immutable prompt template with helper rendering utilities.
+
+    The user template is split around its ``{{context}}`` placeholder once at
+    construction, so rendering is a single ``str.join`` with no rescans.
+    ``cache_key`` (``"<name>-v<version>"``) is a stable provider prompt-cache
+    routing key shared by every request rendered from this template, and
+    ``system_token_estimate`` approximates the system prompt's token count.
+    """
 
     name: PromptName
     version: str
     system_prompt: str
     user_template: str
+    cache_key: str = field(init=False)
+    system_token_estimate: int = field(init=False)
+    _user_parts: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        parts = tuple(self.user_template.split(_CONTEXT_PLACEHOLDER))
+        object.__setattr__(self, "_user_parts", parts)
+        object.__setattr__(self, "cache_key", f"{self.name}-v{self.version}")
+        object.__setattr__(self, "system_token_estimate", estimate_tokens(self.system_prompt))
 
     def render_user_prompt(self, context: str) -> str:
         """Inject runtime context into the template placeholder."""
 
-        return self.user_template.replace("{{context}}", context)
+        return context.join(self._user_parts)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate a BPE token count without loading a tokenizer.
+
+    Counts roughly four ASCII characters per token and one token per other
+    character (CJK text tokenizes close to one token per character).
+    """
+
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
 
 
 def get_prompt_template(name: PromptName) -> PromptTemplate:
     """Return the parsed prompt template for the given provider."""
 
-    return _load_templates()[name]
+    return _TEMPLATES[name]
+
 
+def get_prompt_cache_key(name: PromptName) -> str:
+    """Return the prompt-cache routing key for the given template.
 
-def get_prompt_pair(name: PromptName, context: str) -> tuple[str, str]:
-    """Convenience helper that returns the (system, user) pair."""
+    OpenAI-compatible providers accept it as ``prompt_cache_key`` so requests
+    sharing a system prompt land on the same cache shard.
+    """
 
-    template = get_prompt_template(name)
-    return template.system_prompt, template.render_user_prompt(context)
+    return _TEMPLATES[name].cache_key
 
 
-@lru_cache(maxsize=1)
-def _load_templates() -> dict[PromptName, PromptTemplate]:
+def find_prompt_cache_key(system_prompt: str) -> str | None:
+    """Return the cache key of the template owning ``system_prompt``, if any.
+
+    Providers only receive rendered prompts; the registry hands out the same
+    string objects, so this comparison normally short-circuits on identity.
+    """
+
+    for template in _TEMPLATES.values():
+        if template.system_prompt == system_prompt:
+            return template.cache_key
+    return None
+
+
+def get_prompt_pair(name: PromptName, context: str) -> PromptPair:
+    """Convenience helper that returns the (system, user) pair.
+
+    Rendered pairs are memoized per ``(template, context)``, where the template
+    is the current snapshot's object for ``name``: idle timers often fire
+    repeatedly on an unchanged paragraph, and replaying the identical tuple
+    skips the render entirely.
+    """
+
+    return _render_pair(_TEMPLATES[name], context)
+
+
+def reload_templates() -> None:
+    """Re-read the TOML templates and swap them in as a new snapshot.
+
+    The registry dict is rebuilt and rebound in one assignment, so callers see
+    either the old or the new snapshot, never a mix. Rendered pairs are keyed
+    by template object, so pairs from the old snapshot can never be served for
+    the new one; clearing the cache just releases them early.
+    """
+
+    global _TEMPLATES
+    _TEMPLATES = _build_templates()
+    _render_pair.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _render_pair(template: PromptTemplate, context: str) -> PromptPair:
+    return PromptPair(template.system_prompt, template.render_user_prompt(context))
+
+
+def _build_templates() -> dict[PromptName, PromptTemplate]:
     """Load all templates from the ``server/prompts`` package."""
 
     templates: dict[PromptName, PromptTemplate] = {}
     package = resources.files("server.prompts")
-    prompt_names: tuple[PromptName, ...] = ("muse", "loki")
 
-    for name in prompt_names:
+    for name in PROMPT_NAMES:
         path = package.joinpath(f"{name}.toml")
-        raw = path.read_text(encoding="utf-8")
-        data = tomllib.loads(raw)
-        version = data.get("version")
-        system = data.get("system")
-        user_template = data.get("user_template")
-        if not isinstance(version, str) or not version.strip():
-            raise ValueError(f"Prompt template '{name}' missing version metadata")
-        if not isinstance(system, str) or not system.strip():
-            raise ValueError(f"Prompt template '{name}' missing system prompt")
-        if not isinstance(user_template, str) or "{{context}}" not in user_template:
-            raise ValueError(
-                f"Prompt template '{name}' user_template must include '{{context}}' placeholder"
-            )
+        with path.open("rb") as fp:
+            data = tomllib.load(fp)
+        try:
+            prompt_file = _PromptFile.model_validate(data)
+        except ValidationError as exc:
+            raise ValueError(f"Prompt template '{name}' is invalid: {exc}") from exc
         templates[name] = PromptTemplate(
             name=name,
-            version=version,
-            system_prompt=system.strip("\n"),
-            user_template=user_template.strip("\n"),
+            version=prompt_file.version,
+            # Interned so every rendered pair shares one system-prompt object.
+            system_prompt=sys.intern(prompt_file.system.strip("\n")),
+            user_template=prompt_file.user_template.strip("\n"),
         )
+        if templates[name].system_token_estimate < PROMPT_CACHE_MIN_TOKENS:
+            # Informational only: short prompts are fine, they just miss the
+            # provider prefix cache. Runs at import, before logging is configured.
+            logger.debug(
+                "prompt_prefix_below_cache_threshold",
+                extra={
+                    "prompt": name,
+                    "system_tokens": templates[name].system_token_estimate,
+                    "threshold": PROMPT_CACHE_MIN_TOKENS,
+                },
+            )
 
     return templates
+
+
+# Parsed eagerly at import so the first intervention never pays file IO + parsing.
+_TEMPLATES: dict[PromptName, PromptTemplate] = _build_templates()
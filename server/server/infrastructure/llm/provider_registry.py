@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Literal, cast
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import ClassVar, Literal, cast
 
 from server.domain.errors import LLMProviderError
 from server.domain.llm_provider import LLMProvider
@@ -15,6 +17,11 @@ from server.infrastructure.llm.instructor_provider import InstructorLLMProvider
 
 ProviderName = Literal["openai", "anthropic", "gemini", "debug"]
 
+_KEYED_PROVIDERS: frozenset[str] = frozenset({"openai", "anthropic", "gemini"})
+_ALL_PROVIDERS: frozenset[str] = _KEYED_PROVIDERS | {"debug"}
+
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+
 _API_KEY_ENV: dict[ProviderName, str] = {
     "openai": "OPENAI_API_KEY",
     "anthropic": "ANTHROPIC_API_KEY",
@@ -43,6 +50,14 @@ _TEMP_ENV_VARS: dict[ProviderName, str] = {
     "debug": "DEBUG_TEMPERATURE",
 }
 
+# Client-side request budget for the server's own keys (account-tier specific;
+# unset means unlimited). BYOK instances are per request, so they are not limited.
+_RPM_ENV_VARS: dict[ProviderName, str] = {
+    "openai": "OPENAI_REQUESTS_PER_MINUTE",
+    "anthropic": "ANTHROPIC_REQUESTS_PER_MINUTE",
+    "gemini": "GEMINI_REQUESTS_PER_MINUTE",
+}
+
 _TEMP_FALLBACKS: dict[ProviderName, float] = {
     "openai": 0.9,
     "anthropic": 0.8,
@@ -51,37 +66,72 @@ _TEMP_FALLBACKS: dict[ProviderName, float] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderConfig:
     provider: ProviderName
     api_key: str
     model: str
     temperature: float
+    requests_per_minute: float | None = None
+    repeat_within_session: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderOverride:
     provider: str | None = None
     model: str | None = None
     api_key: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _EnvSnapshot:
+    """Provider settings read from the environment in one pass."""
+
+    api_keys: dict[ProviderName, str | None]
+    models: dict[ProviderName, str]
+    temperatures: dict[ProviderName, float]
+    requests_per_minute: dict[ProviderName, float | None]
+    repeat_within_session: bool
+    allow_debug: bool
+    default_provider: str
+
+
+def _snapshot_env() -> _EnvSnapshot:
+    """Read every provider-related env var once; requests never hit ``os.getenv``."""
+
+    return _EnvSnapshot(
+        api_keys={name: _normalize(os.getenv(env)) for name, env in _API_KEY_ENV.items()},
+        models={name: _default_model(name) for name in _MODEL_ENV_VARS},
+        temperatures={name: _default_temperature(name) for name in _TEMP_ENV_VARS},
+        requests_per_minute={name: _requests_per_minute(name) for name in _RPM_ENV_VARS},
+        repeat_within_session=_is_truthy(os.getenv("MUSE_REPEAT_WITHIN_SESSION")),
+        allow_debug=_is_truthy(os.getenv("LLM_ALLOW_DEBUG_PROVIDER"))
+        or _is_truthy(os.getenv("TESTING")),
+        default_provider=os.getenv("LLM_DEFAULT_PROVIDER", "openai"),
+    )
+
+
 class ProviderRegistry:
     """Resolves provider instances from env defaults or BYOK overrides."""
 
+    # Keyed providers share one constructor signature; debug takes no arguments.
+    _CONSTRUCTORS: ClassVar[dict[str, Callable[..., LLMProvider]]] = {
+        "openai": InstructorLLMProvider,
+        "anthropic": AnthropicLLMProvider,
+        "gemini": GeminiLLMProvider,
+    }
+
     def __init__(self) -> None:
-        self._allow_debug = _is_truthy(os.getenv("LLM_ALLOW_DEBUG_PROVIDER")) or _is_truthy(
-            os.getenv("TESTING")
-        )
-        self.default_provider: ProviderName = self._coerce_provider(
-            os.getenv("LLM_DEFAULT_PROVIDER", "openai")
-        )
+        self._env = _snapshot_env()
+        self._allow_debug = self._env.allow_debug
+        self.default_provider: ProviderName = self._coerce_provider(self._env.default_provider)
         self._default_configs = self._load_default_configs()
         self._default_instances: dict[ProviderName, LLMProvider] = {}
 
     def reload(self) -> None:
         """Reload env backed defaults (used by tests)."""
 
+        self._env = _snapshot_env()
         self._default_configs = self._load_default_configs()
         self._default_instances.clear()
 
@@ -121,36 +171,31 @@ class ProviderRegistry:
                 ProviderConfig(
                     provider="debug",
                     api_key="",
-                    model=model_override or _default_model("debug"),
-                    temperature=_default_temperature("debug"),
+                    model=model_override or self._env.models["debug"],
+                    temperature=self._env.temperatures["debug"],
                 ),
                 True,
             )
 
         if api_key_override:
-            model = model_override or _default_model(normalized_provider)
+            model = model_override or self._env.models[normalized_provider]
             return (
                 ProviderConfig(
                     provider=normalized_provider,
                     api_key=api_key_override,
                     model=model,
-                    temperature=_default_temperature(normalized_provider),
+                    temperature=self._env.temperatures[normalized_provider],
+                    repeat_within_session=self._env.repeat_within_session,
                 ),
                 False,
             )
 
         default_cfg = self._default_configs.get(normalized_provider)
         if default_cfg:
-            model = model_override or default_cfg.model
-            return (
-                ProviderConfig(
-                    provider=normalized_provider,
-                    api_key=default_cfg.api_key,
-                    model=model,
-                    temperature=default_cfg.temperature,
-                ),
-                True,
-            )
+            # The shared default instance is only valid for the default model.
+            if not model_override or model_override == default_cfg.model:
+                return default_cfg, True
+            return replace(default_cfg, model=model_override), False
 
         if allow_blank:
             return None
@@ -163,34 +208,24 @@ class ProviderRegistry:
         )
 
     def _build_provider(self, config: ProviderConfig, *, cacheable: bool) -> LLMProvider:
-        if cacheable:
-            cached = self._default_instances.get(config.provider)
-            if cached is not None:
-                return cached
-
-        provider = self._instantiate(config)
-        if cacheable:
-            self._default_instances[config.provider] = provider
+        if not cacheable:
+            return self._instantiate(config)
+
+        instances = self._default_instances
+        provider = instances.get(config.provider)
+        if provider is None:
+            provider = instances[config.provider] = self._instantiate(config)
         return provider
 
     def _instantiate(self, config: ProviderConfig) -> LLMProvider:
-        if config.provider == "openai":
-            return InstructorLLMProvider(
-                api_key=config.api_key,
-                model=config.model,
-                temperature=config.temperature,
-            )
-        if config.provider == "anthropic":
-            return AnthropicLLMProvider(
-                api_key=config.api_key,
-                model=config.model,
-                temperature=config.temperature,
-            )
-        if config.provider == "gemini":
-            return GeminiLLMProvider(
+        constructor = self._CONSTRUCTORS.get(config.provider)
+        if constructor is not None:
+            return constructor(
                 api_key=config.api_key,
                 model=config.model,
                 temperature=config.temperature,
+                requests_per_minute=config.requests_per_minute,
+                repeat_within_session=config.repeat_within_session,
             )
         if config.provider == "debug":
             return DebugLLMProvider()
@@ -204,16 +239,16 @@ class ProviderRegistry:
     def _load_default_configs(self) -> dict[ProviderName, ProviderConfig]:
         configs: dict[ProviderName, ProviderConfig] = {}
 
-        for provider_name, env_key in _API_KEY_ENV.items():
-            api_key = _normalize(os.getenv(env_key))
+        env = self._env
+        for provider_name, api_key in env.api_keys.items():
             if provider_name == "debug":
                 if not self._allow_debug:
                     continue
                 configs[provider_name] = ProviderConfig(
                     provider=provider_name,
                     api_key="",
-                    model=_default_model(provider_name),
-                    temperature=_default_temperature(provider_name),
+                    model=env.models[provider_name],
+                    temperature=env.temperatures[provider_name],
                 )
                 continue
             if not api_key:
@@ -221,17 +256,17 @@ class ProviderRegistry:
             configs[provider_name] = ProviderConfig(
                 provider=provider_name,
                 api_key=api_key,
-                model=_default_model(provider_name),
-                temperature=_default_temperature(provider_name),
+                model=env.models[provider_name],
+                temperature=env.temperatures[provider_name],
+                requests_per_minute=env.requests_per_minute.get(provider_name),
+                repeat_within_session=env.repeat_within_session,
             )
 
         return configs
 
     def _coerce_provider(self, name: str | None) -> ProviderName:
         normalized = (name or "openai").strip().lower()
-        allowed = {"openai", "anthropic", "gemini"}
-        if self._allow_debug:
-            allowed.add("debug")
+        allowed = _ALL_PROVIDERS if self._allow_debug else _KEYED_PROVIDERS
         if normalized not in allowed:
             raise LLMProviderError(
                 code="unsupported_provider",
@@ -239,7 +274,9 @@ class ProviderRegistry:
                 status_code=422,
                 provider=normalized,
             )
-        return cast(ProviderName, normalized)
+        # Interning maps the name onto the literal used as dict key elsewhere,
+        # so later lookups compare by identity.
+        return cast(ProviderName, sys.intern(normalized))
 
 
 def _normalize(value: str | None) -> str | None:
@@ -264,7 +301,16 @@ def _default_temperature(provider: ProviderName) -> float:
         return _TEMP_FALLBACKS[provider]
 
 
+def _requests_per_minute(provider: ProviderName) -> float | None:
+    env_value = _normalize(os.getenv(_RPM_ENV_VARS[provider]))
+    if env_value is None:
+        return None
+    try:
+        limit = float(env_value)
+    except ValueError:
+        return None
+    return limit if limit > 0 else None
+
+
 def _is_truthy(value: str | None) -> bool:
-    if value is None:
-        return False
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value is not None and value.strip().lower() in _TRUTHY
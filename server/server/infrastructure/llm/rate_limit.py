@@ -0,0 +1,37 @@
+"""Client-side throttling for outbound LLM provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+
+    The bucket starts full, so short bursts up to ``rate`` pass immediately;
+    afterwards callers wait for tokens to refill at a steady pace. All state is
+    touched between awaits on a single event loop, so no lock is needed.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0) -> None:
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.capacity = float(rate)
+        self._fill_per_second = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self._fill_per_second
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._fill_per_second)
@@ -4,9 +4,20 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import UTC, datetime
+import time
 from typing import Any
 
+import orjson
+
+# Attributes every LogRecord carries (plus those Formatter.format may add);
+# anything else on ``record.__dict__`` came from ``extra=``.
+_STD_LOGRECORD_KEYS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__.keys() | {"message", "asctime"}
+)
+
+# Set once setup_json_logging has installed its handler on the root logger.
+_JSON_LOGGING_CONFIGURED = False
+
 
 class JsonFormatter(logging.Formatter):
     """Serialize log records as structured JSON.
@@ -25,34 +36,53 @@ class JsonFormatter(logging.Formatter):
     def __init__(self, *, default_fields: set[str] | None = None) -> None:
         super().__init__()
         self._base_fields = default_fields or self.DEFAULT_FIELDS
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") swapped as one tuple so threads
+        # sharing the formatter never see a mismatched pair.
+        self._second_cache: tuple[int, str] = (-1, "")
 
     def format(self, record: logging.LogRecord) -> str:  # noqa: A003 (formatter API)
         payload: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Include user-supplied extras while avoiding private attrs
-        for key, value in record.__dict__.items():
-            if key in payload or key.startswith("_"):
-                continue
-            if key in {"args", "msg", "exc_info", "exc_text", "stack_info"}:
-                continue
-            payload[key] = value
+        # Include user-supplied extras while avoiding private attrs. The set
+        # difference is empty for plain log calls, which then skip the loop.
+        extra_keys = record.__dict__.keys() - _STD_LOGRECORD_KEYS
+        if extra_keys:
+            for key, value in record.__dict__.items():
+                if key in extra_keys and key not in payload and not key.startswith("_"):
+                    payload[key] = value
 
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(payload, default=str, ensure_ascii=False)
+        try:
+            return orjson.dumps(payload, default=str).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects a few values json tolerates (e.g. ints beyond 64 bits).
+            return json.dumps(payload, default=str, ensure_ascii=False)
+
+    def _format_timestamp(self, created: float) -> str:
+        """Render ``created`` as ISO 8601 UTC, formatting each second only once."""
+
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}+00:00"
 
 
 def setup_json_logging(level: str = "INFO") -> None:
     """Configure root logger with the JSON formatter if not already set."""
 
+    global _JSON_LOGGING_CONFIGURED
+
     root = logging.getLogger()
-    if any(isinstance(handler.formatter, JsonFormatter) for handler in root.handlers):
+    if _JSON_LOGGING_CONFIGURED:
         root.setLevel(level)
         return
 
@@ -60,3 +90,4 @@ def setup_json_logging(level: str = "INFO") -> None:
     handler.setFormatter(JsonFormatter())
     root.handlers = [handler]
     root.setLevel(level)
+    _JSON_LOGGING_CONFIGURED = True
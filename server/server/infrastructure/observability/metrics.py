@@ -33,6 +33,10 @@ if ENABLE_PROM_METRICS:
         buckets=(0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0),
     )
 
+# Bound (counter, histogram) children per (provider, mode, success) so each
+# call skips prometheus_client's label validation and lookup.
+_label_cache: dict[tuple[str, str, bool], tuple[Counter, Histogram]] = {}
+
 
 def log_llm_call(
     *,
@@ -50,7 +54,7 @@ def log_llm_call(
         "provider": provider_name,
         "model": model,
         "mode": mode,
-        "duration_ms": round(duration_ms, 2),
+        "duration_ms": duration_ms,
         "success": success,
     }
     if error_code:
@@ -62,12 +66,21 @@ def log_llm_call(
         logger.warning("llm_call_failed", extra=extra)
 
     if ENABLE_PROM_METRICS and LLM_REQUEST_COUNTER and LLM_LATENCY_HIST:
-        LLM_REQUEST_COUNTER.labels(
-            provider=provider_name,
-            mode=mode,
-            success=str(success).lower(),
-        ).inc()
-        LLM_LATENCY_HIST.labels(provider=provider_name, mode=mode).observe(duration_ms / 1000)
+        key = (provider_name, mode, success)
+        children = _label_cache.get(key)
+        if children is None:
+            children = (
+                LLM_REQUEST_COUNTER.labels(
+                    provider=provider_name,
+                    mode=mode,
+                    success="true" if success else "false",
+                ),
+                LLM_LATENCY_HIST.labels(provider=provider_name, mode=mode),
+            )
+            _label_cache[key] = children
+        counter, histogram = children
+        counter.inc()
+        histogram.observe(duration_ms * 0.001)
 
 
 def prometheus_latest() -> tuple[bytes, str]:
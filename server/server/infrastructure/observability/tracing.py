@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterator
-from contextlib import contextmanager
-from typing import Any
+from types import TracebackType
+from typing import Any, Final, Literal
 
 try:
     from opentelemetry import trace
@@ -34,7 +33,11 @@ if trace and OTLP_ENDPOINT:
     provider = TracerProvider(resource=resource)
     headers = None
     if OTLP_HEADERS:
-        headers = dict(item.split("=") for item in OTLP_HEADERS.split(",") if "=" in item)
+        headers = {}
+        for item in OTLP_HEADERS.split(","):
+            key, sep, value = item.partition("=")
+            if sep:
+                headers[key.strip()] = value.strip()
     exporter = OTLPSpanExporter(endpoint=OTLP_ENDPOINT, headers=headers)
     provider.add_span_processor(BatchSpanProcessor(exporter))
     trace.set_tracer_provider(provider)
@@ -45,18 +48,58 @@ def is_tracing_enabled() -> bool:
     return _tracer is not None
 
 
-@contextmanager
-def start_llm_span(name: str, attributes: dict[str, Any] | None = None) -> Iterator[None]:
+class _NullSpan:
+    """Context manager used when tracing is disabled; does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        return False
+
+
+_NULL_SPAN: Final = _NullSpan()
+
+
+class _RealSpan:
+    """Start a span on enter and end it on exit, marking it failed on error."""
+
+    __slots__ = ("_attributes", "_name", "_scope", "_span", "_tracer")
+
+    def __init__(self, tracer: TracerType, name: str, attributes: dict[str, Any] | None) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._span: Any = None
+        self._scope: Any = None
+
+    def __enter__(self) -> None:
+        self._span = self._tracer.start_span(self._name, attributes=self._attributes)
+        self._scope = trace.use_span(self._span, end_on_exit=True)
+        self._scope.__enter__()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> Literal[False]:
+        self._scope.__exit__(exc_type, exc, tb)
+        if isinstance(exc, Exception):  # pragma: no cover - span records automatically
+            self._span.record_exception(exc)
+            if Status is not None and StatusCode is not None:
+                self._span.set_status(Status(StatusCode.ERROR))
+        return False
+
+
+def start_llm_span(name: str, attributes: dict[str, Any] | None = None) -> _NullSpan | _RealSpan:
     if not _tracer or not trace:
-        yield
-        return
-
-    span = _tracer.start_span(name, attributes=attributes)
-    try:
-        with trace.use_span(span, end_on_exit=True):
-            yield
-    except Exception as exc:  # pragma: no cover - span records automatically
-        span.record_exception(exc)
-        if Status is not None and StatusCode is not None:
-            span.set_status(Status(StatusCode.ERROR))
-        raise
+        return _NULL_SPAN
+    return _RealSpan(_tracer, name, attributes)
@@ -11,16 +11,35 @@ Constitutional Compliance:
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any, Final
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from server.infrastructure.persistence.models import Base
 
+DEFAULT_POOL_SIZE: Final = 20
+DEFAULT_MAX_OVERFLOW: Final = 40
+POOL_RECYCLE_SECONDS: Final = 1800
+
+# asyncpg connection options: cache prepared statements for the repository's
+# repeated queries, bound how long a single command may run, and turn off
+# PostgreSQL's JIT, whose compile step only adds latency to small OLTP queries.
+# The repository issues about a dozen distinct statements; 256 cache slots per
+# connection hold them all without reserving memory for thousands.
+ASYNCPG_CONNECT_ARGS: Final[dict[str, Any]] = {
+    "statement_cache_size": 256,
+    "prepared_statement_cache_size": 256,
+    "command_timeout": 30,
+    "server_settings": {"jit": "off", "application_name": "impetus-lock"},
+}
+
 
 class DatabaseManager:
     """Database connection and session management.
@@ -64,13 +83,28 @@ class DatabaseManager:
         if not self._database_url:
             raise ValueError("DATABASE_URL environment variable not set")
 
+        driver_options: dict[str, Any] = {}
+        if make_url(self._database_url).get_driver_name() == "asyncpg":
+            driver_options = {
+                "connect_args": dict(ASYNCPG_CONNECT_ARGS),
+                # Explicitly set on every pooled connection so sessions run at
+                # PostgreSQL's default level even if the server default changes.
+                "isolation_level": "READ COMMITTED",
+            }
+
         # Create async engine
         self._engine: AsyncEngine = create_async_engine(
             self._database_url,
             echo=False,  # Set to True for SQL query logging
             pool_pre_ping=True,  # Verify connections before using
-            pool_size=5,  # Connection pool size
-            max_overflow=10,  # Max connections beyond pool_size
+            # The asyncio-aware queue pool (the default today); pinned so a plain
+            # QueuePool, which blocks the event loop on checkout, never sneaks in.
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=_env_int("DB_POOL_SIZE", DEFAULT_POOL_SIZE),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW),
+            pool_recycle=POOL_RECYCLE_SECONDS,  # Drop connections idle servers may have cut
+            pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+            **driver_options,
         )
 
         # Create async session factory
@@ -102,8 +136,6 @@ class DatabaseManager:
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
 
     async def create_tables(self) -> None:
         """Create all database tables (development/testing only).
@@ -151,6 +183,16 @@ class DatabaseManager:
         await self._engine.dispose()
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 # Global database manager instance (initialized in main.py)
 _db_manager: DatabaseManager | None = None
 
@@ -175,9 +217,10 @@ def get_db_manager() -> DatabaseManager:
             ...
         ```
     """
-    if _db_manager is None:
+    manager = _db_manager
+    if manager is None:
         raise RuntimeError("Database manager not initialized. Call init_database() first.")
-    return _db_manager
+    return manager
 
 
 def init_database(database_url: str | None = None) -> DatabaseManager | None:
@@ -216,21 +259,23 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 
     Raises RuntimeError when database is not initialized.
     """
-    if _db_manager is None:
+    manager = _db_manager
+    if manager is None:
         raise RuntimeError("Database manager not initialized")
 
-    async with _db_manager.session() as session:
+    async with manager.session() as session:
         yield session
 
 
 async def get_session_optional() -> AsyncGenerator[AsyncSession | None, None]:
     """Optional database session dependency for fallback modes."""
 
-    if _db_manager is None:
+    manager = _db_manager
+    if manager is None:
         yield None
         return
 
-    async with _db_manager.session() as session:
+    async with manager.session() as session:
         yield session
 
 
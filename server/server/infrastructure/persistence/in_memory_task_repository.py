@@ -5,19 +5,39 @@ Provides lightweight persistence when PostgreSQL is unavailable.
 
 from __future__ import annotations
 
+import bisect
+from dataclasses import replace
 from typing import Literal
 from uuid import UUID
 
 from server.domain.entities.intervention_action import InterventionAction
 from server.domain.entities.task import Task
-from server.domain.repositories.task_repository import TaskRepository
+from server.domain.repositories.task_repository import (
+    ActionCursor,
+    TaskVersionConflictError,
+    validate_action_page,
+)
 
 ActionType = Literal["provoke", "delete", "rewrite"]
 AgentMode = Literal["muse", "loki"]
 
 
-class InMemoryTaskRepository(TaskRepository):
-    """Simple in-memory repository for tasks and intervention actions."""
+def _action_key(action: InterventionAction) -> ActionCursor:
+    return (action.issued_at, action.id)
+
+
+def _copy_task(task: Task) -> Task:
+    # Tasks are mutable; hand out and store copies so callers cannot change the
+    # stored version behind the repository's back (as a database row would behave).
+    return replace(task, lock_ids=list(task.lock_ids))
+
+
+class InMemoryTaskRepository:
+    """Simple in-memory repository for tasks and intervention actions.
+
+    Each task's actions are kept sorted oldest-first by ``(issued_at, id)``, so
+    newest-first pages and keyset cursors are resolved with a binary search.
+    """
 
     def __init__(self) -> None:
         self._tasks: dict[UUID, Task] = {}
@@ -25,17 +45,28 @@ class InMemoryTaskRepository(TaskRepository):
 
     async def create_task(self, content: str, lock_ids: list[str]) -> Task:
         task = Task.create(content, lock_ids)
-        self._tasks[task.id] = task
+        self._tasks[task.id] = _copy_task(task)
         self._actions.setdefault(task.id, [])
         return task
 
     async def get_task(self, task_id: UUID) -> Task | None:
-        return self._tasks.get(task_id)
+        task = self._tasks.get(task_id)
+        return _copy_task(task) if task is not None else None
+
+    async def get_tasks(self, task_ids: list[UUID]) -> dict[UUID, Task]:
+        tasks = self._tasks
+        return {task_id: _copy_task(tasks[task_id]) for task_id in task_ids if task_id in tasks}
 
     async def update_task(self, task: Task) -> Task:
-        if task.id not in self._tasks:
+        stored = self._tasks.get(task.id)
+        if stored is None:
             raise ValueError(f"Task {task.id} not found")
-        self._tasks[task.id] = task
+        if stored.version != task.version - 1:
+            raise TaskVersionConflictError(
+                f"Task {task.id} was modified concurrently "
+                f"(expected stored version {task.version - 1})"
+            )
+        self._tasks[task.id] = _copy_task(task)
         return task
 
     async def delete_task(self, task_id: UUID) -> None:
@@ -45,14 +76,43 @@ class InMemoryTaskRepository(TaskRepository):
         self._actions.pop(task_id, None)
 
     async def save_action(self, action: InterventionAction) -> InterventionAction:
-        self._actions.setdefault(action.task_id, []).append(action)
+        bisect.insort(self._actions.setdefault(action.task_id, []), action, key=_action_key)
         return action
 
+    async def save_actions(self, actions: list[InterventionAction]) -> list[InterventionAction]:
+        for action in actions:
+            await self.save_action(action)
+        return actions
+
+    async def has_actions(self, action_ids: list[str]) -> list[bool]:
+        known = {a.action_id for actions in self._actions.values() for a in actions}
+        return [action_id in known for action_id in action_ids]
+
     async def get_actions(
-        self, task_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        task_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: ActionCursor | None = None,
     ) -> list[InterventionAction]:
+        validate_action_page(limit, offset)
         actions = self._actions.get(task_id, [])
-        return actions[offset : offset + limit]
+        end = (
+            len(actions) if cursor is None else bisect.bisect_left(actions, cursor, key=_action_key)
+        )
+        end -= offset
+        if end <= 0:
+            return []
+        start = end - limit
+        # One reversed slice yields the page newest-first without an extra copy.
+        return actions[end - 1 : start - 1 if start > 0 else None : -1]
+
+    async def get_actions_with_count(
+        self, task_id: UUID, limit: int = 100, offset: int = 0
+    ) -> tuple[list[InterventionAction], int]:
+        page = await self.get_actions(task_id, limit=limit, offset=offset)
+        return page, len(self._actions.get(task_id, []))
 
     async def get_action_count(self, task_id: UUID) -> int:
         return len(self._actions.get(task_id, []))
@@ -10,7 +10,7 @@ Constitutional Compliance:
 
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     TIMESTAMP,
@@ -25,6 +25,8 @@ from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from server.domain.uuid7 import uuid7
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models.
@@ -39,7 +41,7 @@ class TaskModel(Base):
     """Task ORM model (maps to 'tasks' table).
 
     Attributes:
-        id: Primary key (UUID).
+        id: Primary key (time-ordered UUIDv7).
         content: Task content (Markdown text).
         lock_ids: Array of lock IDs for un-deletable blocks.
         created_at: Creation timestamp (UTC).
@@ -50,7 +52,7 @@ class TaskModel(Base):
 
     __tablename__ = "tasks"
 
-    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     lock_ids: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False, server_default="{}")
     created_at: Mapped[datetime] = mapped_column(
@@ -80,7 +82,7 @@ class InterventionActionModel(Base):
     """Intervention action ORM model (maps to 'intervention_actions' table).
 
     Attributes:
-        id: Primary key (UUID).
+        id: Primary key (time-ordered UUIDv7).
         task_id: Foreign key to tasks table.
         action_type: "provoke", "delete", or "rewrite".
         action_id: Client-facing action identifier (e.g., "act_xxxxx").
@@ -96,7 +98,7 @@ class InterventionActionModel(Base):
 
     __tablename__ = "intervention_actions"
 
-    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     task_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
     )
@@ -126,8 +128,9 @@ class InterventionActionModel(Base):
             ") OR (action_type = 'delete' AND content IS NULL AND lock_id IS NULL)",
             name="actions_mutation_payload_check",
         ),
-        Index("idx_actions_task_id", "task_id"),
-        Index("idx_actions_action_id", "action_id"),
-        Index("idx_actions_issued_at", "issued_at"),
         Index("idx_actions_mode", "mode"),
+        # Serves every per-task action query: equality on task_id, then a backward
+        # range scan for ORDER BY issued_at DESC, id DESC (no sort step), keyset
+        # cursors, and index-only COUNT(id). Also covers the FK cascade lookup.
+        Index("idx_actions_task_issued_id", "task_id", "issued_at", "id"),
     )
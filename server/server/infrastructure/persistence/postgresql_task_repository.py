@@ -4,31 +4,92 @@ Implements task persistence using SQLAlchemy + PostgreSQL with async support.
 
 Constitutional Compliance:
 - Article I (Simplicity): Uses framework-native SQLAlchemy async patterns
-- Article IV (SOLID - DIP): Implements TaskRepository abstraction
+- Article IV (SOLID - DIP): Satisfies the TaskRepository protocol structurally
 - Article IV (SOLID - SRP): Single responsibility (task persistence only)
 - Article V (Documentation): Complete Google-style docstrings
 """
 
-from typing import Literal, cast
+from dataclasses import fields
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    CursorResult,
+    Integer,
+    bindparam,
+    delete,
+    func,
+    lambda_stmt,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.domain.entities.intervention_action import InterventionAction
 from server.domain.entities.task import Task
-from server.domain.repositories.task_repository import TaskRepository
+from server.domain.repositories.task_repository import (
+    ActionCursor,
+    TaskVersionConflictError,
+    validate_action_page,
+)
 from server.infrastructure.persistence.models import (
     InterventionActionModel,
     TaskModel,
 )
 
-# Type aliases for literal types (used for casting ORM strings to domain literals)
-ActionType = Literal["provoke", "delete", "rewrite"]
-AgentMode = Literal["muse", "loki"]
+_Action = InterventionActionModel
+
+# Action columns in InterventionAction field order. History pages select these
+# plain columns and build entities positionally, skipping ORM instance
+# construction and instrumented attribute access for every row.
+_ACTION_COLUMNS = tuple(getattr(_Action, field.name) for field in fields(InterventionAction))
+
+# Typed bind parameters shared by the statements below (filled per call).
+_TASK_ID = bindparam("task_id", type_=_Action.task_id.type)
+_LIMIT = bindparam("limit", type_=Integer())
+_OFFSET = bindparam("offset", type_=Integer())
+_CURSOR_ISSUED_AT = bindparam("cursor_issued_at", type_=_Action.issued_at.type)
+_CURSOR_ID = bindparam("cursor_id", type_=_Action.id.type)
+
+# Action queries as lambda statements: SQLAlchemy builds each one and its cache
+# key once (keyed on the lambda's code), so a call only binds parameters.
+_ACTION_PAGE_STMT = lambda_stmt(
+    lambda: (
+        select(*_ACTION_COLUMNS)
+        .where(_Action.task_id == _TASK_ID)
+        .order_by(_Action.issued_at.desc(), _Action.id.desc())
+        .limit(_LIMIT)
+        .offset(_OFFSET)
+    )
+)
+_ACTION_PAGE_AFTER_CURSOR_STMT = lambda_stmt(
+    lambda: (
+        select(*_ACTION_COLUMNS)
+        .where(
+            _Action.task_id == _TASK_ID,
+            tuple_(_Action.issued_at, _Action.id) < tuple_(_CURSOR_ISSUED_AT, _CURSOR_ID),
+        )
+        .order_by(_Action.issued_at.desc(), _Action.id.desc())
+        .limit(_LIMIT)
+        .offset(_OFFSET)
+    )
+)
+_ACTION_PAGE_WITH_TOTAL_STMT = lambda_stmt(
+    lambda: (
+        select(*_ACTION_COLUMNS, func.count().over().label("total"))
+        .where(_Action.task_id == _TASK_ID)
+        .order_by(_Action.issued_at.desc(), _Action.id.desc())
+        .limit(_LIMIT)
+        .offset(_OFFSET)
+    )
+)
+_ACTION_COUNT_STMT = lambda_stmt(
+    lambda: select(func.count(_Action.id)).where(_Action.task_id == _TASK_ID)
+)
 
 
-class PostgreSQLTaskRepository(TaskRepository):
+class PostgreSQLTaskRepository:
     """PostgreSQL implementation of TaskRepository using SQLAlchemy async.
 
     Provides persistent storage for tasks and intervention actions with:
@@ -111,11 +172,32 @@ class PostgreSQLTaskRepository(TaskRepository):
                 print(f"Found: {task.content}")
             ```
         """
-        result = await self._session.execute(select(TaskModel).where(TaskModel.id == task_id))
-        model = result.scalar_one_or_none()
+        # Primary-key load: answered from the identity map when already loaded.
+        model = await self._session.get(TaskModel, task_id)
 
         return self._to_entity(model) if model else None
 
+    async def get_tasks(self, task_ids: list[UUID]) -> dict[UUID, Task]:
+        """Get several tasks by ID with a single ``WHERE id = ANY(...)`` query.
+
+        Args:
+            task_ids: Task UUIDs to fetch.
+
+        Returns:
+            dict[UUID, Task]: Found tasks keyed by ID; missing IDs are absent.
+
+        Example:
+            ```python
+            tasks = await repository.get_tasks([first_id, second_id])
+            ```
+        """
+        if not task_ids:
+            return {}
+
+        result = await self._session.execute(select(TaskModel).where(TaskModel.id.in_(task_ids)))
+
+        return {model.id: self._to_entity(model) for model in result.scalars()}
+
     async def update_task(self, task: Task) -> Task:
         """Update existing task with optimistic locking.
 
@@ -126,7 +208,8 @@ class PostgreSQLTaskRepository(TaskRepository):
             Task: Updated task entity with incremented version.
 
         Raises:
-            ValueError: If task not found or version mismatch (optimistic locking).
+            TaskVersionConflictError: If the stored version is not ``task.version - 1``.
+            ValueError: If task not found.
 
         Example:
             ```python
@@ -136,22 +219,33 @@ class PostgreSQLTaskRepository(TaskRepository):
             await session.commit()
             ```
         """
-        # Fetch current model
-        result = await self._session.execute(select(TaskModel).where(TaskModel.id == task.id))
-        model = result.scalar_one_or_none()
-
-        if not model:
-            raise ValueError(f"Task {task.id} not found")
-
-        # Update model fields (version already validated and incremented by entity)
-        model.content = task.content
-        model.lock_ids = task.lock_ids
-        model.updated_at = task.updated_at
-        model.version = task.version
+        # Single conditional UPDATE: the version predicate makes the check and
+        # the write atomic, and no SELECT is needed beforehand. The entity has
+        # already incremented its version, so the stored row must be one behind.
+        result = await self._session.execute(
+            update(TaskModel)
+            .where(TaskModel.id == task.id, TaskModel.version == task.version - 1)
+            .values(
+                content=task.content,
+                lock_ids=task.lock_ids,
+                updated_at=task.updated_at,
+                version=task.version,
+            )
+        )
 
-        await self._session.flush()
+        if cast(CursorResult[Any], result).rowcount == 0:
+            # Failure path only: tell a missing row apart from a stale version.
+            exists = await self._session.execute(
+                select(TaskModel.id).where(TaskModel.id == task.id)
+            )
+            if exists.scalar() is None:
+                raise ValueError(f"Task {task.id} not found")
+            raise TaskVersionConflictError(
+                f"Task {task.id} was modified concurrently "
+                f"(expected stored version {task.version - 1})"
+            )
 
-        return self._to_entity(model)
+        return task
 
     async def delete_task(self, task_id: UUID) -> None:
         """Delete task and cascade delete all associated intervention actions.
@@ -171,15 +265,13 @@ class PostgreSQLTaskRepository(TaskRepository):
             assert task is None
             ```
         """
-        result = await self._session.execute(select(TaskModel).where(TaskModel.id == task_id))
-        model = result.scalar_one_or_none()
+        # One DELETE round-trip; the intervention_actions FK is ON DELETE CASCADE,
+        # so the database removes the history without the ORM loading it.
+        result = await self._session.execute(delete(TaskModel).where(TaskModel.id == task_id))
 
-        if not model:
+        if cast(CursorResult[Any], result).rowcount == 0:
             raise ValueError(f"Task {task_id} not found")
 
-        await self._session.delete(model)
-        await self._session.flush()
-
     async def save_action(self, action: InterventionAction) -> InterventionAction:
         """Save intervention action to history (audit log).
 
@@ -206,38 +298,83 @@ class PostgreSQLTaskRepository(TaskRepository):
             await session.commit()
             ```
         """
-        model = InterventionActionModel(
-            id=action.id,
-            task_id=action.task_id,
-            action_type=action.action_type,
-            action_id=action.action_id,
-            lock_id=action.lock_id,
-            content=action.content,
-            anchor=action.anchor,
-            mode=action.mode,
-            context=action.context,
-            issued_at=action.issued_at,
-            created_at=action.created_at,
-        )
+        await self.save_actions([action])
+        return action
 
-        self._session.add(model)
+    async def save_actions(self, actions: list[InterventionAction]) -> list[InterventionAction]:
+        """Save several intervention actions with a single flush.
+
+        SQLAlchemy batches the pending rows into one multi-row INSERT, so a burst
+        of actions costs one round-trip instead of one per action.
+
+        Args:
+            actions: InterventionAction domain entities to persist.
+
+        Returns:
+            list[InterventionAction]: Saved action entities (same order).
+
+        Example:
+            ```python
+            saved = await repository.save_actions([first_action, second_action])
+            await session.commit()
+            ```
+        """
+        self._session.add_all([self._action_to_model(action) for action in actions])
         await self._session.flush()
 
-        return action
+        return actions
+
+    async def has_actions(self, action_ids: list[str]) -> list[bool]:
+        """Check which action IDs exist with one query on the unique action_id index.
+
+        Args:
+            action_ids: Action identifiers (e.g., "act_xxxxx").
+
+        Returns:
+            list[bool]: One flag per input ID, in the same order.
+
+        Example:
+            ```python
+            exists = await repository.has_actions(["act_001", "act_002"])
+            ```
+        """
+        if not action_ids:
+            return []
+
+        result = await self._session.execute(
+            select(InterventionActionModel.action_id).where(
+                InterventionActionModel.action_id.in_(action_ids)
+            )
+        )
+        found = set(result.scalars())
+
+        return [action_id in found for action_id in action_ids]
 
     async def get_actions(
-        self, task_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        task_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        cursor: ActionCursor | None = None,
     ) -> list[InterventionAction]:
         """Get intervention action history for task (paginated).
 
+        With ``cursor`` the query seeks straight to the position through the
+        ``(task_id, issued_at, id)`` index instead of scanning skipped rows.
+
         Args:
             task_id: Task UUID.
             limit: Maximum number of actions to return (default 100).
             offset: Number of actions to skip for pagination (default 0).
+            cursor: ``(issued_at, id)`` of the last action already seen.
 
         Returns:
             list[InterventionAction]: Actions in reverse chronological order (newest first).
 
+        Raises:
+            ValueError: If ``limit``/``offset`` exceed the pagination caps.
+
         Example:
             ```python
             # Get most recent 10 actions
@@ -246,15 +383,51 @@ class PostgreSQLTaskRepository(TaskRepository):
                 print(f"{action.issued_at}: {action.action_type}")
             ```
         """
+        validate_action_page(limit, offset)
+        params: dict[str, Any] = {"task_id": task_id, "limit": limit, "offset": offset}
+        if cursor is None:
+            result = await self._session.execute(_ACTION_PAGE_STMT, params)
+        else:
+            params["cursor_issued_at"], params["cursor_id"] = cursor
+            result = await self._session.execute(_ACTION_PAGE_AFTER_CURSOR_STMT, params)
+
+        return [InterventionAction(*row) for row in result]
+
+    async def get_actions_with_count(
+        self, task_id: UUID, limit: int = 100, offset: int = 0
+    ) -> tuple[list[InterventionAction], int]:
+        """Get a page of actions and the task's total action count in one query.
+
+        The total comes from ``COUNT(*) OVER ()``, evaluated over the filtered
+        rows before LIMIT/OFFSET, so every returned row carries it.
+
+        Args:
+            task_id: Task UUID.
+            limit: Maximum number of actions to return (default 100).
+            offset: Number of actions to skip for pagination (default 0).
+
+        Returns:
+            tuple[list[InterventionAction], int]: Actions newest first, and the total count.
+
+        Raises:
+            ValueError: If ``limit``/``offset`` exceed the pagination caps.
+
+        Example:
+            ```python
+            actions, total = await repository.get_actions_with_count(task_id, limit=10)
+            ```
+        """
+        validate_action_page(limit, offset)
         result = await self._session.execute(
-            select(InterventionActionModel)
-            .where(InterventionActionModel.task_id == task_id)
-            .order_by(InterventionActionModel.issued_at.desc())
-            .limit(limit)
-            .offset(offset)
+            _ACTION_PAGE_WITH_TOTAL_STMT, {"task_id": task_id, "limit": limit, "offset": offset}
         )
+        rows = result.all()
+        if not rows:
+            # An empty page carries no total; only then fall back to counting.
+            total = await self.get_action_count(task_id) if offset else 0
+            return [], total
 
-        return [self._action_to_entity(m) for m in result.scalars().all()]
+        return [InterventionAction(*row[:-1]) for row in rows], rows[0].total
 
     async def get_action_count(self, task_id: UUID) -> int:
         """Get total count of intervention actions for task.
@@ -271,11 +444,7 @@ class PostgreSQLTaskRepository(TaskRepository):
             print(f"Total actions: {count}")
             ```
         """
-        result = await self._session.execute(
-            select(func.count(InterventionActionModel.id)).where(
-                InterventionActionModel.task_id == task_id
-            )
-        )
+        result = await self._session.execute(_ACTION_COUNT_STMT, {"task_id": task_id})
 
         return result.scalar() or 0
 
@@ -299,27 +468,25 @@ class PostgreSQLTaskRepository(TaskRepository):
         )
 
     @staticmethod
-    def _action_to_entity(model: InterventionActionModel) -> InterventionAction:
-        """Convert InterventionActionModel (ORM) to InterventionAction (domain entity).
+    def _action_to_model(action: InterventionAction) -> InterventionActionModel:
+        """Convert InterventionAction (domain entity) to InterventionActionModel (ORM).
 
         Args:
-            model: SQLAlchemy ORM model.
+            action: Domain entity.
 
         Returns:
-            InterventionAction: Domain entity.
+            InterventionActionModel: SQLAlchemy ORM model.
         """
-        # Cast ORM string types to domain Literal types
-        # DB CHECK constraints guarantee valid values, so casts are safe
-        return InterventionAction(
-            id=model.id,
-            task_id=model.task_id,
-            action_type=cast(ActionType, model.action_type),
-            action_id=model.action_id,
-            lock_id=model.lock_id,
-            content=model.content,
-            anchor=model.anchor,
-            mode=cast(AgentMode, model.mode),
-            context=model.context,
-            issued_at=model.issued_at,
-            created_at=model.created_at,
+        return InterventionActionModel(
+            id=action.id,
+            task_id=action.task_id,
+            action_type=action.action_type,
+            action_id=action.action_id,
+            lock_id=action.lock_id,
+            content=action.content,
+            anchor=action.anchor,
+            mode=action.mode,
+            context=action.context,
+            issued_at=action.issued_at,
+            created_at=action.created_at,
         )
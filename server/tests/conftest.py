@@ -6,6 +6,7 @@ Sets up test environment with mocked OpenAI API key.
 import os
 
 import pytest
+from fastapi.testclient import TestClient
 
 from server.api.main import app as fastapi_app
 from server.infrastructure.cache.idempotency_cache import AsyncIdempotencyCache
@@ -28,14 +29,36 @@ def setup_test_environment() -> None:
     os.environ["OPENAI_API_KEY"] = "test-key-for-unit-tests"
 
 
+@pytest.fixture(scope="session")
+def provider_registry(setup_test_environment: None) -> ProviderRegistry:
+    """Build the provider registry once per session (after the env is set up).
+
+    Tests that need different provider settings assign their own fresh
+    ``ProviderRegistry()`` to ``app.state``; the next test gets this one back.
+    """
+
+    return ProviderRegistry()
+
+
 @pytest.fixture(autouse=True)
-def ensure_app_state() -> None:
+def ensure_app_state(provider_registry: ProviderRegistry) -> None:
     """Ensure shared app.state resources exist for tests."""
 
-    fastapi_app.state.provider_registry = ProviderRegistry()
+    fastapi_app.state.provider_registry = provider_registry
     fastapi_app.state.idempotency_cache = AsyncIdempotencyCache(ttl=15)
 
 
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """Share one TestClient across the session.
+
+    The lifespan is not entered (it requires DATABASE_URL); ``ensure_app_state``
+    provides the app.state resources the routes need instead.
+    """
+
+    return TestClient(fastapi_app)
+
+
 @pytest.fixture
 def anyio_backend() -> str:
     """Force anyio tests to use asyncio backend (trio not installed in dev env)."""
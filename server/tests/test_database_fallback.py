@@ -1,5 +1,8 @@
 """Tests for database fallback behavior in TESTING mode."""
 
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
 import pytest
 
 from server.infrastructure.persistence import database
@@ -18,3 +21,36 @@ def test_init_database_allows_testing_fallback(monkeypatch: pytest.MonkeyPatch)
 
     assert result is None
     assert database.is_database_initialized() is False
+
+
+class FakeManager:
+    """Records session() usage in place of a real DatabaseManager."""
+
+    def __init__(self) -> None:
+        self.errors: list[BaseException] = []
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[str]:
+        try:
+            yield "session"
+        except Exception as exc:
+            self.errors.append(exc)
+            raise
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("dependency", [database.get_session, database.get_session_optional])
+async def test_session_dependencies_delegate_to_manager(
+    monkeypatch: pytest.MonkeyPatch, dependency: Callable[[], AsyncGenerator[object, None]]
+) -> None:
+    """Both dependencies yield the manager's session and surface errors through it."""
+
+    manager = FakeManager()
+    monkeypatch.setattr(database, "_db_manager", manager)
+
+    dependency_gen = dependency()
+    assert await anext(dependency_gen) == "session"
+
+    with pytest.raises(RuntimeError):
+        await dependency_gen.athrow(RuntimeError("request failed"))
+    assert [str(exc) for exc in manager.errors] == ["request failed"]
@@ -15,6 +15,19 @@ from server.infrastructure.cache.idempotency_cache import AsyncIdempotencyCache
 pytestmark = pytest.mark.anyio
 
 
+class FakeClock:
+    """Manually advanced nanosecond clock for TTL tests."""
+
+    def __init__(self) -> None:
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * 1_000_000_000)
+
+
 async def test_set_and_get_basic() -> None:
     cache = AsyncIdempotencyCache(ttl=1)
     key = "test_key_001"
@@ -25,11 +38,13 @@ async def test_set_and_get_basic() -> None:
 
 
 async def test_get_expired_entry_returns_none() -> None:
-    cache = AsyncIdempotencyCache(ttl=1)
+    clock = FakeClock()
+    cache = AsyncIdempotencyCache(ttl=1, clock=clock)
     await cache.set("expire_test", {"data": "value"})
-    await asyncio.sleep(1.1)
+    clock.advance(1.1)
 
     assert await cache.get("expire_test") is None
+    await cache.close()
 
 
 async def test_clear_removes_all_entries() -> None:
@@ -44,17 +59,48 @@ async def test_clear_removes_all_entries() -> None:
 
 
 async def test_cleanup_expired_counts_removed() -> None:
-    cache = AsyncIdempotencyCache(ttl=1)
+    clock = FakeClock()
+    cache = AsyncIdempotencyCache(ttl=1, clock=clock)
     await cache.set("k1", 1)
     await cache.set("k2", 2)
-    await asyncio.sleep(1.1)
-    await cache.set("fresh", 3)
+    await cache.close()  # stop the reaper so cleanup_expired sees the stale entries
+    clock.advance(1.1)
 
     removed = await cache.cleanup_expired()
+    await cache.set("fresh", 3)
 
     assert removed == 2
     assert await cache.get("fresh") == 3
     assert await cache.get("k1") is None
+    await cache.close()
+
+
+async def test_reaper_evicts_expired_entries_in_background() -> None:
+    # The reaper sleeps on the event loop, so this test uses a real (short) TTL.
+    cache = AsyncIdempotencyCache(ttl=0.05)
+    await cache.set("k1", 1)
+    await cache.set("k2", 2)
+    await asyncio.sleep(0.1)
+
+    assert await cache.cleanup_expired() == 0
+    assert await cache.get("k1") is None
+
+    await cache.set("fresh", 3)
+    assert await cache.get("fresh") == 3
+    await cache.close()
+
+
+async def test_maxsize_evicts_oldest_entries() -> None:
+    cache = AsyncIdempotencyCache(ttl=2, maxsize=2)
+    await cache.set("k1", 1)
+    await cache.set("k2", 2)
+    await cache.set("k1", 11)  # refresh moves k1 behind k2
+    await cache.set("k3", 3)
+
+    assert await cache.get("k2") is None
+    assert await cache.get("k1") == 11
+    assert await cache.get("k3") == 3
+    await cache.close()
 
 
 async def test_concurrent_access_is_safe() -> None:
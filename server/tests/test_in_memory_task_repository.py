@@ -0,0 +1,100 @@
+"""Tests for the in-memory TaskRepository used in TESTING/fallback mode."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+
+from server.domain.entities.intervention_action import InterventionAction
+from server.domain.repositories.task_repository import TaskVersionConflictError
+from server.infrastructure.persistence.in_memory_task_repository import InMemoryTaskRepository
+
+pytestmark = pytest.mark.anyio
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _delete_action(task_id: UUID, index: int) -> InterventionAction:
+    return InterventionAction.create(
+        task_id=task_id,
+        action_type="delete",
+        action_id=f"act_{index:03d}",
+        anchor={"type": "range", "from": 0, "to": 5},
+        mode="loki",
+        context="上下文",
+        issued_at=BASE_TIME + timedelta(seconds=index),
+    )
+
+
+async def _repo_with_actions(count: int) -> tuple[InMemoryTaskRepository, UUID]:
+    repo = InMemoryTaskRepository()
+    task = await repo.create_task("内容", [])
+    # Save out of order to exercise the sorted insert.
+    for index in reversed(range(count)):
+        await repo.save_action(_delete_action(task.id, index))
+    return repo, task.id
+
+
+async def test_get_actions_returns_newest_first_with_offset() -> None:
+    repo, task_id = await _repo_with_actions(5)
+
+    first = await repo.get_actions(task_id, limit=2)
+    second = await repo.get_actions(task_id, limit=2, offset=2)
+
+    assert [a.action_id for a in first] == ["act_004", "act_003"]
+    assert [a.action_id for a in second] == ["act_002", "act_001"]
+    assert await repo.get_actions(task_id, offset=5) == []
+
+
+async def test_get_actions_cursor_continues_after_last_seen() -> None:
+    repo, task_id = await _repo_with_actions(5)
+
+    page = await repo.get_actions(task_id, limit=2)
+    last = page[-1]
+    next_page = await repo.get_actions(task_id, limit=10, cursor=(last.issued_at, last.id))
+
+    assert [a.action_id for a in next_page] == ["act_002", "act_001", "act_000"]
+
+
+async def test_get_actions_with_count_reports_total_beyond_page() -> None:
+    repo, task_id = await _repo_with_actions(5)
+
+    page, total = await repo.get_actions_with_count(task_id, limit=2, offset=4)
+
+    assert [a.action_id for a in page] == ["act_000"]
+    assert total == 5
+
+
+@pytest.mark.parametrize(("limit", "offset"), [(0, 0), (101, 0), (10, -1), (100, 9_901)])
+async def test_get_actions_rejects_unbounded_pages(limit: int, offset: int) -> None:
+    repo, task_id = await _repo_with_actions(1)
+
+    with pytest.raises(ValueError):
+        await repo.get_actions(task_id, limit=limit, offset=offset)
+
+
+async def test_bulk_lookups_return_per_key_results() -> None:
+    repo, task_id = await _repo_with_actions(2)
+    missing = UUID(int=0)
+
+    tasks = await repo.get_tasks([task_id, missing])
+
+    assert list(tasks) == [task_id]
+    assert await repo.has_actions(["act_001", "act_999", "act_000"]) == [True, False, True]
+
+
+async def test_update_task_rejects_stale_version() -> None:
+    repo = InMemoryTaskRepository()
+    task = await repo.create_task("内容", [])
+    first = await repo.get_task(task.id)
+    second = await repo.get_task(task.id)
+    assert first is not None and second is not None
+
+    first.update_content("先写入", [])
+    await repo.update_task(first)
+    second.update_content("后写入", [])
+
+    with pytest.raises(TaskVersionConflictError):
+        await repo.update_task(second)
+    stored = await repo.get_task(task.id)
+    assert stored is not None and stored.content == "先写入"
@@ -19,6 +19,8 @@ from server.domain.llm_provider import LLMProvider
 from server.domain.models.anchor import AnchorPos, AnchorRange
 from server.domain.models.intervention import ClientMeta, InterventionRequest, InterventionResponse
 
+pytestmark = pytest.mark.anyio
+
 
 class TestInterventionService:
     """Test suite for InterventionService business logic."""
@@ -47,7 +49,7 @@ class TestInterventionService:
             ),
         )
 
-    def test_delegates_to_llm_provider(
+    async def test_delegates_to_llm_provider(
         self,
         service: InterventionService,
         mock_llm_provider: Mock,
@@ -67,7 +69,7 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = expected_response
 
         # Act
-        response = service.generate_intervention(valid_muse_request)
+        response = await service.generate_intervention(valid_muse_request)
 
         # Assert
         mock_llm_provider.generate_intervention.assert_called_once_with(
@@ -80,7 +82,7 @@ class TestInterventionService:
         assert response == expected_response
         assert response.source == "muse"
 
-    def test_safety_guard_prevents_delete_on_short_context(
+    async def test_safety_guard_prevents_delete_on_short_context(
         self, service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test safety guard forces provoke when context <50 chars and LLM returns delete."""
@@ -104,7 +106,7 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = llm_delete_response
 
         # Act
-        response = service.generate_intervention(short_request)
+        response = await service.generate_intervention(short_request)
 
         # Assert - Service overrides to provoke
         assert response.action == "provoke"
@@ -114,7 +116,7 @@ class TestInterventionService:
         assert response.lock_id.startswith("lock_")
         assert response.source == "loki"
 
-    def test_allows_delete_on_sufficient_context(
+    async def test_allows_delete_on_sufficient_context(
         self, service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test delete action is allowed when context >= 50 chars."""
@@ -140,7 +142,7 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = llm_delete_response
 
         # Act
-        response = service.generate_intervention(long_request)
+        response = await service.generate_intervention(long_request)
 
         # Assert - Delete is preserved
         assert response.action == "delete"
@@ -148,7 +150,7 @@ class TestInterventionService:
         assert response.lock_id is None
         assert response.source == "loki"
 
-    def test_preserves_provoke_action_unchanged(
+    async def test_preserves_provoke_action_unchanged(
         self,
         service: InterventionService,
         mock_llm_provider: Mock,
@@ -168,7 +170,7 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = llm_provoke_response
 
         # Act
-        response = service.generate_intervention(valid_muse_request)
+        response = await service.generate_intervention(valid_muse_request)
 
         # Assert - No modifications
         assert response == llm_provoke_response
@@ -176,7 +178,9 @@ class TestInterventionService:
         assert response.content == "Original content"
         assert response.lock_id == "lock_original_001"
 
-    def test_handles_loki_mode(self, service: InterventionService, mock_llm_provider: Mock) -> None:
+    async def test_handles_loki_mode(
+        self, service: InterventionService, mock_llm_provider: Mock
+    ) -> None:
         """Test Loki mode requests are handled correctly."""
         # Arrange
         loki_request = InterventionRequest(
@@ -197,7 +201,7 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = loki_response
 
         # Act
-        response = service.generate_intervention(loki_request)
+        response = await service.generate_intervention(loki_request)
 
         # Assert
         mock_llm_provider.generate_intervention.assert_called_once_with(
@@ -209,7 +213,7 @@ class TestInterventionService:
         )
         assert response.action == "provoke"
 
-    def test_handles_zero_values_in_client_meta(
+    async def test_handles_zero_values_in_client_meta(
         self, service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test handling of zero/boundary values in client_meta fields."""
@@ -236,7 +240,7 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = mock_response
 
         # Act
-        response = service.generate_intervention(zero_meta_request)
+        response = await service.generate_intervention(zero_meta_request)
 
         # Assert
         mock_llm_provider.generate_intervention.assert_called_once_with(
@@ -248,7 +252,7 @@ class TestInterventionService:
         )
         assert response.action == "provoke"
 
-    def test_safety_guard_boundary_exactly_50_chars(
+    async def test_safety_guard_boundary_exactly_50_chars(
         self, service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test safety guard boundary: exactly 50 characters should allow delete."""
@@ -271,12 +275,12 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = llm_delete_response
 
         # Act
-        response = service.generate_intervention(exact_request)
+        response = await service.generate_intervention(exact_request)
 
         # Assert - 50 chars is NOT < 50, so delete is allowed
         assert response.action == "delete"
 
-    def test_safety_guard_boundary_49_chars(
+    async def test_safety_guard_boundary_49_chars(
         self, service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test safety guard boundary: 49 characters should force provoke."""
@@ -299,13 +303,13 @@ class TestInterventionService:
         mock_llm_provider.generate_intervention.return_value = llm_delete_response
 
         # Act
-        response = service.generate_intervention(short_request)
+        response = await service.generate_intervention(short_request)
 
         # Assert - 49 chars < 50, so forced to provoke
         assert response.action == "provoke"
         assert response.source == "loki"
 
-    def test_muse_mode_never_returns_delete(
+    async def test_muse_mode_never_returns_delete(
         self,
         service: InterventionService,
         mock_llm_provider: Mock,
@@ -322,13 +326,13 @@ class TestInterventionService:
             source="muse",
         )
 
-        response = service.generate_intervention(valid_muse_request)
+        response = await service.generate_intervention(valid_muse_request)
 
         assert response.action == "provoke"
         assert response.lock_id is not None
         assert response.source == "muse"
 
-    def test_rewrite_action_provides_lock_and_range(
+    async def test_rewrite_action_provides_lock_and_range(
         self,
         service: InterventionService,
         mock_llm_provider: Mock,
@@ -346,14 +350,14 @@ class TestInterventionService:
         )
         mock_llm_provider.generate_intervention.return_value = llm_response
 
-        response = service.generate_intervention(valid_muse_request)
+        response = await service.generate_intervention(valid_muse_request)
 
         assert response.action == "rewrite"
         assert response.lock_id is not None
         assert response.source == "muse"
         assert response.anchor.type == "range"
 
-    def test_rewrite_anchor_aligns_with_last_sentence(
+    async def test_rewrite_anchor_aligns_with_last_sentence(
         self,
         service: InterventionService,
         mock_llm_provider: Mock,
@@ -383,7 +387,7 @@ class TestInterventionService:
         )
         mock_llm_provider.generate_intervention.return_value = llm_response
 
-        response = service.generate_intervention(request)
+        response = await service.generate_intervention(request)
 
         last_sentence = "他必须在‘清道夫’之前拿到那个芯片。"
         expected_from = cursor - len(last_sentence)
@@ -392,7 +396,7 @@ class TestInterventionService:
         assert response.anchor.from_ == expected_from
         assert response.anchor.to == cursor
 
-    def test_missing_provider_raises_configuration_error(
+    async def test_missing_provider_raises_configuration_error(
         self, valid_muse_request: InterventionRequest
     ) -> None:
         """Service should raise when no provider (and no override) is available."""
@@ -400,4 +404,4 @@ class TestInterventionService:
         service = InterventionService(llm_provider=None)
 
         with pytest.raises(LLMProviderError):
-            service.generate_intervention(valid_muse_request)
+            await service.generate_intervention(valid_muse_request)
@@ -0,0 +1,39 @@
+"""Unit tests for the structured JSON log formatter."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+from server.infrastructure.logging.json_formatter import JsonFormatter
+
+
+def test_json_formatter_emits_extras_only() -> None:
+    record = logging.LogRecord("server.test", logging.INFO, __file__, 1, "llm_call", None, None)
+    record.provider = "openai"
+    record._private = "hidden"
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "llm_call"
+    assert payload["provider"] == "openai"
+    assert "_private" not in payload
+    assert "lineno" not in payload
+
+
+def test_json_formatter_timestamp_uses_record_created() -> None:
+    record = logging.LogRecord("server.test", logging.INFO, __file__, 1, "event", None, None)
+    record.created = 1_700_000_000.25
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["timestamp"] == "2023-11-14T22:13:20.250000+00:00"
+
+
+def test_json_formatter_falls_back_for_values_orjson_rejects() -> None:
+    record = logging.LogRecord("server.test", logging.INFO, __file__, 1, "event", None, None)
+    record.big = 2**70
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["big"] == 2**70
@@ -7,11 +7,10 @@ from typing import Any, cast
 from _pytest.logging import LogCaptureFixture
 from fastapi.testclient import TestClient
 
-from server.api.main import app
 
-
-def test_http_request_logging_includes_basic_fields(caplog: LogCaptureFixture) -> None:
-    client = TestClient(app)
+def test_http_request_logging_includes_basic_fields(
+    client: TestClient, caplog: LogCaptureFixture
+) -> None:
     caplog.set_level("INFO")
 
     response = client.get("/health")
@@ -26,8 +25,7 @@ def test_http_request_logging_includes_basic_fields(caplog: LogCaptureFixture) -
     assert log_record.duration_ms >= 0
 
 
-def test_http_exception_logs_real_status(caplog: LogCaptureFixture) -> None:
-    client = TestClient(app)
+def test_http_exception_logs_real_status(client: TestClient, caplog: LogCaptureFixture) -> None:
     caplog.set_level("INFO")
 
     response = client.post("/impetus/generate-intervention", json={})
@@ -25,6 +25,8 @@ from server.domain.llm_provider import LLMProvider
 from server.domain.models.anchor import AnchorPos, AnchorRange
 from server.domain.models.intervention import ClientMeta, InterventionRequest, InterventionResponse
 
+pytestmark = pytest.mark.anyio
+
 
 class TestLokiModeLogic:
     """Test suite for Loki mode decision logic and safety guards."""
@@ -39,7 +41,7 @@ class TestLokiModeLogic:
         """Create InterventionService with mocked LLM provider."""
         return InterventionService(llm_provider=mock_llm_provider)
 
-    def test_loki_mode_randomly_selects_provoke_or_delete(
+    async def test_loki_mode_randomly_selects_provoke_or_delete(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test that Loki mode can return either Provoke or Delete action.
@@ -73,7 +75,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Verify Provoke action
         assert response.action == "provoke"
@@ -92,7 +94,7 @@ class TestLokiModeLogic:
             source="loki",
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Verify Delete action (safety guard should NOT trigger)
         assert response.action == "delete"
@@ -112,13 +114,13 @@ class TestLokiModeLogic:
             source="loki",
         )
 
-        rewrite_response = intervention_service.generate_intervention(request)
+        rewrite_response = await intervention_service.generate_intervention(request)
         assert rewrite_response.action == "rewrite"
         assert rewrite_response.lock_id is not None
         assert rewrite_response.anchor.type == "range"
         assert rewrite_response.source == "loki"
 
-    def test_safety_guard_prevents_delete_on_short_context(
+    async def test_safety_guard_prevents_delete_on_short_context(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test that documents <50 chars force Provoke action (reject Delete).
@@ -148,7 +150,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Safety guard should OVERRIDE Delete → Provoke
         assert response.action == "provoke"
@@ -156,7 +158,7 @@ class TestLokiModeLogic:
         assert response.content is not None
         assert response.source == "loki"
 
-    def test_allows_delete_on_sufficient_context(
+    async def test_allows_delete_on_sufficient_context(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test that documents ≥50 chars allow Delete action."""
@@ -186,7 +188,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Should allow Delete action (no safety guard override)
         assert response.action == "delete"
@@ -195,7 +197,7 @@ class TestLokiModeLogic:
         assert response.anchor.from_ < response.anchor.to
         assert response.source == "loki"
 
-    def test_safety_guard_boundary_exactly_50_chars(
+    async def test_safety_guard_boundary_exactly_50_chars(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test boundary condition: exactly 50 chars should allow Delete."""
@@ -221,13 +223,13 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # At boundary (50 chars), should allow Delete
         assert response.action == "delete"
         assert response.source == "loki"
 
-    def test_safety_guard_boundary_49_chars(
+    async def test_safety_guard_boundary_49_chars(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test boundary condition: 49 chars should force Provoke."""
@@ -253,7 +255,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Below boundary, should force Provoke
         assert response.action == "provoke"
@@ -261,7 +263,7 @@ class TestLokiModeLogic:
         assert response.source == "loki"
         assert response.source == "loki"
 
-    def test_delete_action_includes_valid_anchor(
+    async def test_delete_action_includes_valid_anchor(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test that Delete action always has valid anchor range (from < to)."""
@@ -290,7 +292,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Verify anchor is valid
         assert response.anchor.type == "range"
@@ -300,7 +302,7 @@ class TestLokiModeLogic:
         assert response.anchor.to > 0
         assert response.source == "loki"
 
-    def test_provoke_action_includes_lock_id_and_content(
+    async def test_provoke_action_includes_lock_id_and_content(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test that Provoke action always has lock_id and content."""
@@ -325,7 +327,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Verify Provoke has required fields
         assert response.action == "provoke"
@@ -335,7 +337,7 @@ class TestLokiModeLogic:
         assert len(response.content) > 0
         assert response.source == "loki"
 
-    def test_handles_loki_mode_string(
+    async def test_handles_loki_mode_string(
         self, intervention_service: InterventionService, mock_llm_provider: Mock
     ) -> None:
         """Test that mode='loki' string is handled correctly."""
@@ -359,7 +361,7 @@ class TestLokiModeLogic:
             ),
         )
 
-        response = intervention_service.generate_intervention(request)
+        response = await intervention_service.generate_intervention(request)
 
         # Verify mode is processed correctly
         assert response.action in ["provoke", "delete"]
@@ -6,18 +6,14 @@ Article III (TDD): These tests drive the implementation of health endpoint.
 
 from fastapi.testclient import TestClient
 
-from server.api.main import app
 
-client = TestClient(app)
-
-
-def test_health_endpoint_returns_200() -> None:
+def test_health_endpoint_returns_200(client: TestClient) -> None:
     """Test that health endpoint returns successful status code."""
     response = client.get("/health")
     assert response.status_code == 200
 
 
-def test_health_endpoint_returns_correct_structure() -> None:
+def test_health_endpoint_returns_correct_structure(client: TestClient) -> None:
     """Test that health endpoint returns expected JSON structure."""
     response = client.get("/health")
     body = response.json()
@@ -27,7 +23,7 @@ def test_health_endpoint_returns_correct_structure() -> None:
     assert "version" in body
 
 
-def test_health_endpoint_returns_correct_values() -> None:
+def test_health_endpoint_returns_correct_values(client: TestClient) -> None:
     """Test that health endpoint returns expected values."""
     response = client.get("/health")
     body = response.json()
@@ -11,7 +11,9 @@ from server.infrastructure.cache.idempotency_cache import AsyncIdempotencyCache
 from server.infrastructure.llm.provider_registry import ProviderRegistry
 
 
-def test_byok_headers_never_logged(monkeypatch: MonkeyPatch, caplog: LogCaptureFixture) -> None:
+def test_byok_headers_never_logged(
+    client: TestClient, monkeypatch: MonkeyPatch, caplog: LogCaptureFixture
+) -> None:
     monkeypatch.setenv("LLM_ALLOW_DEBUG_PROVIDER", "1")
     monkeypatch.setenv("LLM_DEFAULT_PROVIDER", "debug")
 
@@ -19,7 +21,6 @@ def test_byok_headers_never_logged(monkeypatch: MonkeyPatch, caplog: LogCaptureF
     app.state.provider_registry._allow_debug = True  # test hook
     app.state.idempotency_cache = AsyncIdempotencyCache(ttl=15)
 
-    client = TestClient(app)
     caplog.set_level("DEBUG")
 
     response = client.post(
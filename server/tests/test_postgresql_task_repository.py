@@ -0,0 +1,219 @@
+"""Tests for the PostgreSQL TaskRepository query layer.
+
+The suite runs without a database, so the statements are compiled against the
+PostgreSQL dialect and the repository is driven through a recording session.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import fields
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.domain.entities.intervention_action import InterventionAction
+from server.domain.entities.task import Task
+from server.domain.repositories.task_repository import TaskVersionConflictError
+from server.infrastructure.persistence import postgresql_task_repository as repo_module
+from server.infrastructure.persistence.postgresql_task_repository import PostgreSQLTaskRepository
+
+pytestmark = pytest.mark.anyio
+
+TASK_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+KEYSET_ORDER = "ORDER BY intervention_actions.issued_at DESC, intervention_actions.id DESC"
+
+
+class PageRow(tuple[Any, ...]):
+    """Result row whose trailing ``total`` window column is exposed by name."""
+
+    @property
+    def total(self) -> Any:
+        return self[-1]
+
+
+class FakeResult:
+    """Minimal stand-in for the SQLAlchemy result API used by the repository."""
+
+    def __init__(self, rows: list[tuple[Any, ...]], scalar: Any = None, rowcount: int = 0) -> None:
+        self._rows = rows
+        self._scalar = scalar
+        self.rowcount = rowcount
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        return iter(self._rows)
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return list(self._rows)
+
+    def scalar(self) -> Any:
+        return self._scalar
+
+
+class RecordingSession:
+    """Records executed statements and replays queued results in order."""
+
+    def __init__(self, *results: FakeResult) -> None:
+        self.results = list(results)
+        self.calls: list[tuple[Any, dict[str, Any]]] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> FakeResult:
+        self.calls.append((statement, params or {}))
+        return self.results.pop(0)
+
+
+def _compile(statement: Any) -> tuple[str, list[str]]:
+    compiled = statement.compile(dialect=postgresql.dialect())
+    return " ".join(str(compiled).split()), list(compiled.params)
+
+
+def _action(index: int) -> InterventionAction:
+    return InterventionAction.create(
+        task_id=TASK_ID,
+        action_type="provoke",
+        action_id=f"act_{index:03d}",
+        lock_id=f"lock_{index:03d}",
+        content="门后传来脚步声。",
+        anchor={"type": "pos", "from": index},
+        mode="muse",
+        context="上下文",
+        issued_at=BASE_TIME + timedelta(seconds=index),
+    )
+
+
+def _row(action: InterventionAction) -> tuple[Any, ...]:
+    return tuple(getattr(action, column.key) for column in repo_module._ACTION_COLUMNS)
+
+
+def test_action_columns_match_entity_fields_in_order() -> None:
+    entity_fields = fields(InterventionAction)
+
+    assert [column.key for column in repo_module._ACTION_COLUMNS] == [
+        field.name for field in entity_fields
+    ]
+    # Rows are passed positionally, so every field must be an __init__ argument.
+    assert all(field.init for field in entity_fields)
+
+
+def test_model_row_round_trips_to_entity() -> None:
+    action = _action(5)
+    model = PostgreSQLTaskRepository._action_to_model(action)
+    row = tuple(getattr(model, column.key) for column in repo_module._ACTION_COLUMNS)
+
+    assert InterventionAction(*row) == action
+
+
+@pytest.mark.parametrize(
+    ("statement", "binds"),
+    [
+        (repo_module._ACTION_PAGE_STMT, ["task_id", "limit", "offset"]),
+        (repo_module._ACTION_PAGE_WITH_TOTAL_STMT, ["task_id", "limit", "offset"]),
+        (
+            repo_module._ACTION_PAGE_AFTER_CURSOR_STMT,
+            ["task_id", "cursor_issued_at", "cursor_id", "limit", "offset"],
+        ),
+    ],
+)
+def test_page_statements_use_keyset_order_and_named_binds(statement: Any, binds: list[str]) -> None:
+    sql, params = _compile(statement)
+
+    assert params == binds
+    assert "WHERE intervention_actions.task_id = %(task_id)s::UUID" in sql
+    assert f"{KEYSET_ORDER} LIMIT %(limit)s::INTEGER OFFSET %(offset)s::INTEGER" in sql
+
+
+def test_cursor_statement_compares_row_values() -> None:
+    sql, _ = _compile(repo_module._ACTION_PAGE_AFTER_CURSOR_STMT)
+
+    assert (
+        "(intervention_actions.issued_at, intervention_actions.id) < "
+        "(%(cursor_issued_at)s::TIMESTAMP WITH TIME ZONE, %(cursor_id)s::UUID)"
+    ) in sql
+
+
+def test_total_statement_counts_over_the_unpaged_window() -> None:
+    sql, _ = _compile(repo_module._ACTION_PAGE_WITH_TOTAL_STMT)
+
+    assert "count(*) OVER () AS total FROM intervention_actions" in sql
+
+
+async def test_get_actions_binds_cursor_and_builds_entities() -> None:
+    newer, older = _action(2), _action(1)
+    session = RecordingSession(FakeResult([_row(older)]))
+    repository = PostgreSQLTaskRepository(cast(AsyncSession, session))
+
+    actions = await repository.get_actions(TASK_ID, limit=10, cursor=(newer.issued_at, newer.id))
+
+    statement, params = session.calls[0]
+    assert statement is repo_module._ACTION_PAGE_AFTER_CURSOR_STMT
+    assert params == {
+        "task_id": TASK_ID,
+        "limit": 10,
+        "offset": 0,
+        "cursor_issued_at": newer.issued_at,
+        "cursor_id": newer.id,
+    }
+    assert actions == [older]
+
+
+async def test_get_actions_with_count_takes_total_from_window_column() -> None:
+    page = [_action(3), _action(2)]
+    session = RecordingSession(FakeResult([PageRow((*_row(a), 7)) for a in page]))
+    repository = PostgreSQLTaskRepository(cast(AsyncSession, session))
+
+    actions, total = await repository.get_actions_with_count(TASK_ID, limit=2, offset=1)
+
+    assert session.calls[0][0] is repo_module._ACTION_PAGE_WITH_TOTAL_STMT
+    assert actions == page
+    assert total == 7
+
+
+async def test_get_actions_with_count_counts_only_when_page_past_end() -> None:
+    session = RecordingSession(FakeResult([]), FakeResult([], scalar=4))
+    repository = PostgreSQLTaskRepository(cast(AsyncSession, session))
+
+    assert await repository.get_actions_with_count(TASK_ID, limit=2, offset=10) == ([], 4)
+    assert session.calls[1][0] is repo_module._ACTION_COUNT_STMT
+
+    empty_session = RecordingSession(FakeResult([]))
+    empty_repository = PostgreSQLTaskRepository(cast(AsyncSession, empty_session))
+
+    assert await empty_repository.get_actions_with_count(TASK_ID) == ([], 0)
+    assert len(empty_session.calls) == 1
+
+
+async def test_update_task_applies_version_guard() -> None:
+    task = Task.create("内容", [])
+    task.update_content("新内容", [])
+    session = RecordingSession(FakeResult([], rowcount=1))
+    repository = PostgreSQLTaskRepository(cast(AsyncSession, session))
+
+    assert await repository.update_task(task) is task
+
+    sql, _ = _compile(session.calls[0][0])
+    assert "WHERE tasks.id = %(id_1)s::UUID AND tasks.version = %(version_1)s::INTEGER" in sql
+    assert session.calls[0][0].compile().params["version_1"] == 0
+
+
+@pytest.mark.parametrize(
+    ("existing_id", "error"),
+    [(UUID(int=1), TaskVersionConflictError), (None, ValueError)],
+    ids=["stale-version", "missing-task"],
+)
+async def test_update_task_distinguishes_conflict_from_missing(
+    existing_id: UUID | None, error: type[ValueError]
+) -> None:
+    task = Task.create("内容", [])
+    task.update_content("新内容", [])
+    session = RecordingSession(FakeResult([], rowcount=0), FakeResult([], scalar=existing_id))
+    repository = PostgreSQLTaskRepository(cast(AsyncSession, session))
+
+    with pytest.raises(error) as excinfo:
+        await repository.update_task(task)
+
+    assert (type(excinfo.value) is TaskVersionConflictError) == (existing_id is not None)
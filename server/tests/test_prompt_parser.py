@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import asyncio
+from typing import Any, Literal
 
 import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
+from server.domain.errors import LLMProviderError
 from server.infrastructure.llm.base_provider import BasePromptLLMProvider, LLMInterventionDraft
+from server.infrastructure.llm.draft_cache import DraftCache
+
+pytestmark = pytest.mark.anyio
 
 
 class FakeProvider(BasePromptLLMProvider):
     """Test double that returns a pre-seeded draft."""
 
-    def __init__(self, draft: LLMInterventionDraft):
-        super().__init__(model="fake")
+    def __init__(self, draft: LLMInterventionDraft, **settings: Any):
+        super().__init__(model="fake", **settings)
         self._draft = draft
 
-    def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+    async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
         return self._draft
 
 
@@ -33,7 +38,7 @@ def _make_draft(
     action=st.sampled_from(["provoke", "rewrite", "delete"]),
     content=st.one_of(st.none(), st.text(min_size=1, max_size=120)),
 )
-def test_generate_intervention_enforces_content_requirements(
+async def test_generate_intervention_enforces_content_requirements(
     action: Literal["provoke", "rewrite", "delete"],
     content: str | None,
 ) -> None:
@@ -44,13 +49,13 @@ def test_generate_intervention_enforces_content_requirements(
 
     if requires_content and missing_content:
         with pytest.raises(ValueError):
-            provider.generate_intervention(
+            await provider.generate_intervention(
                 context="最近写作停滞。",
                 mode="muse",
                 selection_from=10,
             )
     else:
-        response = provider.generate_intervention(
+        response = await provider.generate_intervention(
             context="最近写作停滞。",
             mode="muse",
             selection_from=5,
@@ -65,7 +70,99 @@ def test_generate_intervention_enforces_content_requirements(
             assert response.lock_id is None
 
 
-def test_invalid_mode_raises_value_error() -> None:
+async def test_invalid_mode_raises_value_error() -> None:
     provider = FakeProvider(_make_draft("provoke", "content"))
     with pytest.raises(ValueError):
-        provider.generate_intervention(context="", mode="invalid")  # type: ignore[arg-type]
+        await provider.generate_intervention(context="", mode="invalid")  # type: ignore[arg-type]
+
+
+class CountingProvider(FakeProvider):
+    """Fake provider that records how often the backend is reached."""
+
+    def __init__(self, draft: LLMInterventionDraft, **settings: Any):
+        super().__init__(draft, **settings)
+        self.calls = 0
+
+    async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+        self.calls += 1
+        return await super()._complete(system_prompt, user_message)
+
+
+REPLAY = {"repeat_within_session": True, "temperature": 0.2}
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{}, {"repeat_within_session": True}, {"temperature": 0.2}],
+    ids=["default", "opt-in-at-high-temperature", "low-temperature-without-opt-in"],
+)
+async def test_muse_repeats_reach_provider_unless_replay_enabled(settings: dict[str, Any]) -> None:
+    provider = CountingProvider(_make_draft("provoke", "门后有人。"), **settings)
+
+    for _ in range(3):
+        await provider.generate_intervention(context="他推开门。", mode="muse")
+
+    assert provider.calls == 3
+
+
+async def test_muse_drafts_are_replayed_per_context_when_enabled() -> None:
+    provider = CountingProvider(_make_draft("provoke", "门后有人。"), **REPLAY)
+
+    first = await provider.generate_intervention(context="他推开门。", mode="muse")
+    second = await provider.generate_intervention(context="他推开门。", mode="muse")
+    await provider.generate_intervention(context="她关上窗。", mode="muse")
+
+    assert provider.calls == 2
+    assert first.content == second.content
+    assert first.lock_id != second.lock_id
+
+
+async def test_loki_bypasses_draft_cache() -> None:
+    provider = CountingProvider(_make_draft("delete", None))
+
+    for _ in range(2):
+        await provider.generate_intervention(context="他推开门。", mode="loki", selection_to=5)
+
+    assert provider.calls == 2
+
+
+async def test_concurrent_muse_requests_share_one_call() -> None:
+    class SlowProvider(CountingProvider):
+        async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+            await asyncio.sleep(0.01)
+            return await super()._complete(system_prompt, user_message)
+
+    provider = SlowProvider(_make_draft("provoke", "门后有人。"))
+
+    responses = await asyncio.gather(
+        *(provider.generate_intervention(context="他推开门。", mode="muse") for _ in range(5))
+    )
+
+    assert provider.calls == 1
+    assert len({response.lock_id for response in responses}) == 5
+
+
+async def test_quota_error_opens_breaker() -> None:
+    class ExhaustedProvider(CountingProvider):
+        async def _complete(self, system_prompt: str, user_message: str) -> LLMInterventionDraft:
+            await super()._complete(system_prompt, user_message)
+            raise LLMProviderError(code="quota_exceeded", message="quota", status_code=402)
+
+    provider = ExhaustedProvider(_make_draft("provoke", "门后有人。"))
+
+    for context in ("他推开门。", "她关上窗。"):
+        with pytest.raises(LLMProviderError) as exc_info:
+            await provider.generate_intervention(context=context, mode="muse")
+        assert exc_info.value.code == "quota_exceeded"
+
+    assert provider.calls == 1
+
+
+async def test_expired_drafts_are_refetched() -> None:
+    provider = CountingProvider(_make_draft("provoke", "门后有人。"), **REPLAY)
+    provider.draft_cache = DraftCache(ttl=0.0)
+
+    await provider.generate_intervention(context="他推开门。", mode="muse")
+    await provider.generate_intervention(context="他推开门。", mode="muse")
+
+    assert provider.calls == 2
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
-from server.infrastructure.llm.prompts import loki_prompt, muse_prompt
-from server.infrastructure.llm.prompts.prompt_registry import get_prompt_template
+from dataclasses import replace
+
+import pytest
+
+from server.infrastructure.llm.prompts import loki_prompt, muse_prompt, prompt_registry
+from server.infrastructure.llm.prompts.prompt_registry import (
+    estimate_tokens,
+    find_prompt_cache_key,
+    get_prompt_cache_key,
+    get_prompt_pair,
+    get_prompt_template,
+    reload_templates,
+)
 
 
 def test_muse_prompt_contains_required_constraints() -> None:
@@ -32,3 +43,50 @@ def test_templates_expose_versions() -> None:
     assert muse.version
     assert loki.version
     assert muse.render_user_prompt("ctx") != loki.render_user_prompt("ctx")
+
+
+def test_rendered_pairs_are_memoized_per_context() -> None:
+    first = get_prompt_pair("loki", "门后一片漆黑。")
+
+    assert get_prompt_pair("loki", "门后一片漆黑。") is first
+    assert get_prompt_pair("loki", "窗外下着雨。") is not first
+
+
+def test_cache_keys_are_versioned_per_mode() -> None:
+    muse = get_prompt_template("muse")
+
+    assert get_prompt_cache_key("muse") == f"muse-v{muse.version}"
+    assert get_prompt_cache_key("muse") != get_prompt_cache_key("loki")
+    assert find_prompt_cache_key(muse.system_prompt) == muse.cache_key
+    assert find_prompt_cache_key("unrelated system prompt") is None
+
+
+def test_token_estimate_counts_cjk_per_character() -> None:
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("门后一片漆黑") == 6
+    assert get_prompt_template("muse").system_token_estimate > 0
+
+
+def test_reload_swaps_in_a_fresh_snapshot() -> None:
+    before = get_prompt_template("muse")
+    pair = get_prompt_pair("muse", "他打开门。")
+
+    reload_templates()
+
+    after = get_prompt_template("muse")
+    assert after is not before
+    assert after == before
+    assert get_prompt_pair("muse", "他打开门。") == pair
+
+
+def test_prompt_modules_follow_template_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    muse = get_prompt_template("muse")
+    swapped = replace(muse, system_prompt="新的系统提示", user_template="上文：{{context}}")
+    snapshot = {**prompt_registry._TEMPLATES, "muse": swapped}
+    monkeypatch.setattr(prompt_registry, "_TEMPLATES", snapshot)
+
+    assert muse_prompt.MUSE_SYSTEM_PROMPT == "新的系统提示"
+    assert muse_prompt.get_muse_user_prompt("他打开门。") == "上文：他打开门。"
+    assert muse_prompt.get_muse_prompts("他打开门。") == ("新的系统提示", "上文：他打开门。")
+    loki_system = loki_prompt.LOKI_SYSTEM_PROMPT
+    assert loki_system is snapshot["loki"].system_prompt
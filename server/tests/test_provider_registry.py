@@ -90,3 +90,61 @@ class TestProviderRegistry:
         )
 
         assert isinstance(provider, DebugLLMProvider)
+
+    def test_model_override_bypasses_cached_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-default")
+        monkeypatch.delenv("OPENAI_MODEL", raising=False)
+        registry = ProviderRegistry()
+        registry.reload()
+
+        default = registry.get_provider()
+        overridden = registry.get_provider(overrides=ProviderOverride(model="gpt-4.1-mini"))
+
+        assert overridden is not default
+        assert getattr(overridden, "model", None) == "gpt-4.1-mini"
+        assert registry.get_provider() is default
+
+    def test_requests_per_minute_limits_default_provider(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-default")
+        monkeypatch.setenv("OPENAI_REQUESTS_PER_MINUTE", "120")
+        registry = ProviderRegistry()
+
+        default = registry.get_provider()
+        byok = registry.get_provider(overrides=ProviderOverride(api_key="sk-user"))
+
+        limiter = getattr(default, "_limiter", None)
+        assert limiter is not None
+        assert limiter.capacity == 120
+        assert getattr(byok, "_limiter", "missing") is None
+
+    def test_invalid_requests_per_minute_disables_limiter(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-default")
+        monkeypatch.setenv("OPENAI_REQUESTS_PER_MINUTE", "lots")
+        registry = ProviderRegistry()
+
+        assert getattr(registry.get_provider(), "_limiter", "missing") is None
+
+    @pytest.mark.parametrize(
+        ("flag", "temperature", "replays"),
+        [(None, "0.2", False), ("1", "0.2", True), ("1", "0.9", False)],
+    )
+    def test_muse_replay_is_opt_in_and_low_temperature_only(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        flag: str | None,
+        temperature: str,
+        replays: bool,
+    ) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-default")
+        monkeypatch.setenv("OPENAI_TEMPERATURE", temperature)
+        if flag is None:
+            monkeypatch.delenv("MUSE_REPEAT_WITHIN_SESSION", raising=False)
+        else:
+            monkeypatch.setenv("MUSE_REPEAT_WITHIN_SESSION", flag)
+        registry = ProviderRegistry()
+
+        assert getattr(registry.get_provider(), "replay_drafts", None) is replays
@@ -0,0 +1,52 @@
+"""Unit tests for the outbound LLM TokenBucket."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from server.infrastructure.llm.rate_limit import TokenBucket
+
+pytestmark = pytest.mark.anyio
+
+
+async def _timed_acquire(bucket: TokenBucket) -> float:
+    started = time.monotonic()
+    await bucket.acquire()
+    return time.monotonic() - started
+
+
+async def test_burst_up_to_capacity_passes_immediately() -> None:
+    bucket = TokenBucket(rate=5, period=60)
+
+    for _ in range(5):
+        assert await _timed_acquire(bucket) < 0.01
+
+
+async def test_acquire_waits_for_refill_when_empty() -> None:
+    # 2 tokens per 0.1s refills one token every 50ms.
+    bucket = TokenBucket(rate=2, period=0.1)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    assert await _timed_acquire(bucket) >= 0.04
+
+
+async def test_tokens_refill_over_time_up_to_capacity() -> None:
+    bucket = TokenBucket(rate=2, period=0.1)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    await asyncio.sleep(0.2)  # long enough to refill more than capacity
+
+    assert await _timed_acquire(bucket) < 0.01
+    assert await _timed_acquire(bucket) < 0.01
+    assert await _timed_acquire(bucket) >= 0.04
+
+
+@pytest.mark.parametrize(("rate", "period"), [(0, 60), (10, 0), (-1, 60)])
+def test_rejects_non_positive_settings(rate: float, period: float) -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate, period=period)
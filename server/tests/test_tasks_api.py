@@ -0,0 +1,103 @@
+"""API tests for task update optimistic locking (PUT /tasks/{task_id})."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import replace
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+
+from server.api.dependencies import get_task_repository
+from server.api.main import app
+from server.domain.entities.task import Task
+from server.infrastructure.persistence.in_memory_task_repository import InMemoryTaskRepository
+
+UPDATE_BODY = {"content": "新的内容", "lock_ids": ["lock_1"], "version": 0}
+
+
+class ConcurrentWriterRepository(InMemoryTaskRepository):
+    """Simulates another writer committing between the route's read and write."""
+
+    async def update_task(self, task: Task) -> Task:
+        stored = self._tasks[task.id]
+        self._tasks[task.id] = replace(stored, version=stored.version + 1)
+        return await super().update_task(task)
+
+
+class DeletedBeforeUpdateRepository(InMemoryTaskRepository):
+    """Simulates the task being deleted between the route's read and write."""
+
+    async def update_task(self, task: Task) -> Task:
+        await self.delete_task(task.id)
+        return await super().update_task(task)
+
+
+@pytest.fixture
+def repository(request: pytest.FixtureRequest) -> Iterator[InMemoryTaskRepository]:
+    """Serve the task routes from an in-memory repository (class via indirect param)."""
+
+    repository: InMemoryTaskRepository = getattr(request, "param", InMemoryTaskRepository)()
+
+    async def override_repo() -> InMemoryTaskRepository:
+        return repository
+
+    app.dependency_overrides[get_task_repository] = override_repo
+    try:
+        yield repository
+    finally:
+        app.dependency_overrides.pop(get_task_repository, None)
+
+
+async def _create_task(repository: InMemoryTaskRepository) -> UUID:
+    task = await repository.create_task("原始内容", [])
+    return task.id
+
+
+@pytest.mark.anyio
+async def test_update_increments_version(
+    client: TestClient, repository: InMemoryTaskRepository
+) -> None:
+    task_id = await _create_task(repository)
+
+    response = client.put(f"/tasks/{task_id}", json=UPDATE_BODY)
+
+    assert response.status_code == 200
+    assert response.json()["version"] == 1
+    stored = await repository.get_task(task_id)
+    assert stored is not None and stored.version == 1
+
+
+@pytest.mark.anyio
+async def test_stale_version_returns_409(
+    client: TestClient, repository: InMemoryTaskRepository
+) -> None:
+    task_id = await _create_task(repository)
+    assert client.put(f"/tasks/{task_id}", json=UPDATE_BODY).status_code == 200
+
+    response = client.put(f"/tasks/{task_id}", json=UPDATE_BODY)  # still version 0
+
+    assert response.status_code == 409
+
+
+def test_missing_task_returns_404(client: TestClient, repository: InMemoryTaskRepository) -> None:
+    response = client.put(f"/tasks/{UUID(int=1)}", json=UPDATE_BODY)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("repository", "status_code"),
+    [(ConcurrentWriterRepository, 409), (DeletedBeforeUpdateRepository, 404)],
+    indirect=["repository"],
+)
+async def test_update_race_maps_repository_errors(
+    client: TestClient, repository: InMemoryTaskRepository, status_code: int
+) -> None:
+    task_id = await _create_task(repository)
+
+    response = client.put(f"/tasks/{task_id}", json=UPDATE_BODY)
+
+    assert response.status_code == status_code
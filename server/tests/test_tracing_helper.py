@@ -75,3 +75,13 @@ def test_start_llm_span_sets_error_status_on_exception(reset_tracer: FakeSpan) -
     assert span.record_exception_called is True
     assert isinstance(span.set_status_value, DummyStatus)
     assert span.set_status_value.code == DummyStatusCode.ERROR
+
+
+def test_start_llm_span_is_shared_noop_when_disabled(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(tracing, "_tracer", None)
+
+    span_cm = tracing.start_llm_span("llm.call")
+
+    assert span_cm is tracing.start_llm_span("llm.other")
+    with pytest.raises(RuntimeError), span_cm:
+        raise RuntimeError("boom")
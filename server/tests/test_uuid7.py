@@ -0,0 +1,26 @@
+"""Tests for time-ordered UUIDv7 entity IDs."""
+
+import time
+
+from server.domain.entities.task import Task
+from server.domain.uuid7 import uuid7
+
+
+def test_uuid7_sets_version_variant_and_timestamp() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert value.int >> 80 >= before_ms
+
+
+def test_uuid7_is_strictly_increasing() -> None:
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_task_ids_are_uuid7() -> None:
+    assert Task.create("内容", []).id.version == 7